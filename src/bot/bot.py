@@ -1,12 +1,18 @@
 """Main Discord bot implementation."""
 
+import asyncio
+import hashlib
+import json
 import os
+import sys
+from typing import Optional
 
 import discord
 from discord.ext import commands
 
 from src.config.config_manager import ConfigManager
 from src.config.settings import DISCORD_BOT_TOKEN
+from src.scraper.github_client import GitHubClient
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -15,30 +21,38 @@ logger = setup_logger(__name__)
 class InternshipBot(commands.Bot):
     """Discord bot for scraping and posting internship listings."""
 
+    # Max seconds to wait for the first GUILD_AVAILABLE before starting the scheduler
+    GUILD_AVAILABLE_TIMEOUT = 30.0
+
     def __init__(self, config_manager: ConfigManager):
-        intents = discord.Intents.default()
-        intents.message_content = True
+        # Slash commands and scheduled posts only need guild/channel data;
+        # skip presence, typing, member and message events entirely
+        intents = discord.Intents.none()
+        intents.guilds = True
 
         super().__init__(
-            command_prefix="!",  # Fallback prefix, mainly using slash commands
+            command_prefix=commands.when_mentioned,  # Slash commands only
             intents=intents,
             help_command=None,
+            chunk_guilds_at_startup=False,
         )
 
         self.config_manager = config_manager
+        self.github_client: Optional[GitHubClient] = None
+        self._guild_available = asyncio.Event()
+        self._scheduler_start_task: Optional[asyncio.Task] = None
 
     async def setup_hook(self):
         """Setup hook called when the bot starts."""
+        # Shared GitHub client so commands reuse one pooled HTTP session
+        self.github_client = GitHubClient()
+        await self.github_client.warm()
+
         # Load commands
         from src.bot.commands import config as config_commands
 
         await config_commands.setup(self, self.config_manager)
 
-        # Load scheduler
-        from src.scheduler import tasks
-
-        await tasks.setup(self, self.config_manager)
-
         # Sync commands with Discord
         logger.info("Syncing commands...")
 
@@ -58,14 +72,33 @@ class InternshipBot(commands.Bot):
                 logger.warning(
                     f"Invalid TEST_GUILD_ID: {test_guild_id}, falling back to global sync"
                 )
-                await self.tree.sync()
-                logger.info("Commands synced globally")
+                await self._sync_global_commands()
         else:
             # Production mode: sync globally
-            await self.tree.sync()
-            logger.info(
-                "Commands synced globally (production mode, may take up to 1 hour)"
-            )
+            await self._sync_global_commands()
+
+    def _command_tree_hash(self) -> str:
+        """Hash the global command payload to detect changes between deploys.
+
+        Returns:
+            Hex digest of the serialized global command tree
+        """
+        payload = [command.to_dict(self.tree) for command in self.tree.get_commands()]
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    async def _sync_global_commands(self):
+        """Sync global commands, skipping the API call if nothing changed."""
+        tree_hash = self._command_tree_hash()
+        if tree_hash == self.config_manager.get_command_tree_hash():
+            logger.info("Command tree unchanged since last sync, skipping global sync")
+            return
+
+        await self.tree.sync()
+        await asyncio.to_thread(self.config_manager.set_command_tree_hash, tree_hash)
+        logger.info(
+            "Commands synced globally (production mode, may take up to 1 hour)"
+        )
 
     async def on_ready(self):
         """Called when the bot is ready."""
@@ -73,24 +106,68 @@ class InternshipBot(commands.Bot):
         logger.info(f"Connected to {len(self.guilds)} guild(s)")
         logger.info("Bot is ready!")
 
+        # on_ready can fire again after reconnects; only start the scheduler once
+        if self._scheduler_start_task is None:
+            self._scheduler_start_task = asyncio.create_task(self._start_scheduler())
+
+    async def on_guild_available(self, guild: discord.Guild):
+        """Called when a guild becomes available on the gateway."""
+        self._guild_available.set()
+
+    async def wait_until_guild_available(
+        self, timeout: float = GUILD_AVAILABLE_TIMEOUT
+    ) -> bool:
+        """Wait until at least one guild is available in the cache.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a guild became available before the timeout
+        """
+        try:
+            await asyncio.wait_for(self._guild_available.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _start_scheduler(self):
+        """Load the scheduler once channel lookups can hit the guild cache."""
+        if not await self.wait_until_guild_available():
+            logger.warning(
+                "No guild became available in time, starting scheduler anyway"
+            )
+
+        from src.scheduler import tasks
+
+        await tasks.setup(self, self.config_manager)
+
     async def on_guild_join(self, guild: discord.Guild):
         """Called when the bot joins a new guild."""
-        print(f"[Bot] Joined new guild: {guild.name} (ID: {guild.id})")
+        logger.info("Joined new guild: %s (ID: %s)", guild.name, guild.id)
 
     async def on_guild_remove(self, guild: discord.Guild):
         """Called when the bot is removed from a guild."""
-        print(f"[Bot] Removed from guild: {guild.name} (ID: {guild.id})")
+        logger.info("Removed from guild: %s (ID: %s)", guild.name, guild.id)
 
     async def close(self):
         """Cleanup resources before shutdown."""
         logger.info("Bot shutting down, cleaning up resources...")
 
-        # Cancel scheduler task if running
+        # Cancel pending scheduler startup and the scheduler task if running
+        if self._scheduler_start_task and not self._scheduler_start_task.done():
+            self._scheduler_start_task.cancel()
+
         scraper_cog = self.get_cog("ScraperTasks")
         if scraper_cog:
-            scraper_cog.scrape_task.cancel()
+            # Cancels the scrape loop and the channel posting workers
+            scraper_cog.cog_unload()
             logger.info("Scheduler task cancelled")
 
+        if self.github_client:
+            await self.github_client.close()
+            logger.info("GitHub client session closed")
+
         await super().close()
 
 
@@ -104,7 +181,23 @@ def create_bot() -> InternshipBot:
     return InternshipBot(config_manager)
 
 
+def _install_event_loop_policy():
+    """Use uvloop's event loop when available (not supported on Windows)."""
+    if sys.platform == "win32":
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def run_bot():
     """Run the bot."""
+    _install_event_loop_policy()
     bot = create_bot()
     bot.run(DISCORD_BOT_TOKEN)
@@ -1,11 +1,45 @@
 """Discord slash commands for bot configuration."""
 
+import asyncio
+import itertools
+import time
+from typing import Dict, Tuple
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from src.bot.embeds import create_config_embed, create_internship_embed
 from src.config.config_manager import ConfigManager
+from src.scheduler.tasks import (
+    get_scraper_cog,
+    scrape_and_post,
+    scrape_and_post_with_stats,
+)
+from src.utils.date_utils import format_timestamp
+
+# Permissions the bot needs in a posting channel, as a bitmask
+REQUIRED_PERMISSIONS_MASK = discord.Permissions(
+    send_messages=True, embed_links=True
+).value
+
+SECONDS_PER_DAY = 86400
+
+# Max cached (channel, bot roles) permission lookups before the cache is reset
+PERMISSION_CACHE_SIZE = 256
+
+# Channel validation error messages
+_PERMISSION_ERROR = (
+    "❌ I don't have permission to send messages or embeds in that channel!\n"
+    "Please grant me `Send Messages` and `Embed Links` permissions."
+)
+_SAME_GUILD_ERROR = "❌ Channel must be in this server!"
+
+# Labels used in channel confirmation messages
+_CHANNEL_LABELS = {
+    "summer": "Summer internships",
+    "offseason": "Off-season internships (Fall/Winter/Spring)",
+}
 
 
 class ConfigCommands(commands.Cog):
@@ -14,6 +48,46 @@ class ConfigCommands(commands.Cog):
     def __init__(self, bot: commands.Bot, config_manager: ConfigManager):
         self.bot = bot
         self.config_manager = config_manager
+        # Bot permission bits keyed by (channel_id, hash of the bot's role ids)
+        self._permission_cache: Dict[Tuple[int, int], int] = {}
+        # Rendered /view_config embeds per guild ID,
+        # keyed by (config version, guild name, start timestamp)
+        self._config_embed_cache: Dict[
+            int, Tuple[Tuple[int, str, int], discord.Embed]
+        ] = {}
+
+    def _channel_permissions(
+        self, channel: discord.TextChannel, me: discord.Member
+    ) -> int:
+        """Get the bot's effective permission bits in a channel.
+
+        Args:
+            channel: Channel to check
+            me: The bot's member object in the channel's guild
+
+        Returns:
+            Permissions.value for the bot in that channel
+        """
+        key = (channel.id, hash(tuple(role.id for role in me.roles)))
+        value = self._permission_cache.get(key)
+        if value is None:
+            if len(self._permission_cache) >= PERMISSION_CACHE_SIZE:
+                self._permission_cache.clear()
+            value = channel.permissions_for(me).value
+            self._permission_cache[key] = value
+        return value
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Drop cached permissions when a role's permissions may have changed."""
+        self._permission_cache.clear()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        """Drop cached permissions when channel overwrites may have changed."""
+        self._permission_cache.clear()
 
     @app_commands.command(
         name="set_summer_channel",
@@ -25,47 +99,7 @@ class ConfigCommands(commands.Cog):
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ):
         """Set the summer internships channel."""
-        # Validate bot permissions
-        permissions = channel.permissions_for(interaction.guild.me)
-        if not permissions.send_messages or not permissions.embed_links:
-            await interaction.response.send_message(
-                "❌ I don't have permission to send messages or embeds in that channel!\n"
-                "Please grant me `Send Messages` and `Embed Links` permissions.",
-                ephemeral=True,
-            )
-            return
-
-        # Validate channel is in the same guild
-        if channel.guild.id != interaction.guild_id:
-            await interaction.response.send_message(
-                "❌ Channel must be in this server!", ephemeral=True
-            )
-            return
-
-        # Check if offseason channel already exists
-        offseason_channels = self.config_manager.get_all_channels("offseason")
-
-        self.config_manager.set_channel(
-            guild_id=interaction.guild_id, channel_type="summer", channel_id=channel.id
-        )
-
-        await interaction.response.send_message(
-            f"✅ Summer internships will be posted to {channel.mention}", ephemeral=True
-        )
-
-        # Trigger immediate scrape if BOTH channels are now configured
-        if len(offseason_channels) > 0:
-            from src.scheduler.tasks import scrape_and_post
-
-            await interaction.followup.send(
-                "🔄 Both channels configured! Triggering initial scrape...",
-                ephemeral=True,
-            )
-            await scrape_and_post(self.bot, self.config_manager)
-            await interaction.followup.send(
-                "✅ Initial scrape completed! Internships have been posted.",
-                ephemeral=True,
-            )
+        await self._set_channel(interaction, channel, "summer")
 
     @app_commands.command(
         name="set_offseason_channel",
@@ -77,41 +111,74 @@ class ConfigCommands(commands.Cog):
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ):
         """Set the off-season internships channel."""
+        await self._set_channel(interaction, channel, "offseason")
+
+    async def _validate_channel(
+        self, interaction: discord.Interaction, channel: discord.TextChannel
+    ) -> bool:
+        """Check that the bot can post in a channel of the invoking guild.
+
+        Sends an error followup when validation fails.
+
+        Args:
+            interaction: Deferred slash command interaction
+            channel: Channel to validate
+
+        Returns:
+            True if the channel can be used for postings
+        """
         # Validate bot permissions
-        permissions = channel.permissions_for(interaction.guild.me)
-        if not permissions.send_messages or not permissions.embed_links:
-            await interaction.response.send_message(
-                "❌ I don't have permission to send messages or embeds in that channel!\n"
-                "Please grant me `Send Messages` and `Embed Links` permissions.",
-                ephemeral=True,
-            )
-            return
+        me = interaction.guild.me
+        permissions = self._channel_permissions(channel, me)
+        if (permissions & REQUIRED_PERMISSIONS_MASK) != REQUIRED_PERMISSIONS_MASK:
+            await interaction.followup.send(_PERMISSION_ERROR, ephemeral=True)
+            return False
 
         # Validate channel is in the same guild
         if channel.guild.id != interaction.guild_id:
-            await interaction.response.send_message(
-                "❌ Channel must be in this server!", ephemeral=True
-            )
+            await interaction.followup.send(_SAME_GUILD_ERROR, ephemeral=True)
+            return False
+
+        return True
+
+    async def _set_channel(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel,
+        channel_type: str,
+    ):
+        """Validate and save a posting channel, then scrape if both are set.
+
+        Args:
+            interaction: Slash command interaction
+            channel: Channel to post internships to
+            channel_type: Either 'summer' or 'offseason'
+        """
+        # Acknowledge within Discord's 3s window before doing any work
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self._validate_channel(interaction, channel):
             return
 
-        # Check if summer channel already exists
-        summer_channels = self.config_manager.get_all_channels("summer")
+        # Check if the other channel type already exists
+        other_type = "offseason" if channel_type == "summer" else "summer"
+        other_channels = self.config_manager.get_all_channels(other_type)
 
-        self.config_manager.set_channel(
+        # Write config off the event loop
+        await asyncio.to_thread(
+            self.config_manager.set_channel,
             guild_id=interaction.guild_id,
-            channel_type="offseason",
+            channel_type=channel_type,
             channel_id=channel.id,
         )
 
-        await interaction.response.send_message(
-            f"✅ Off-season internships (Fall/Winter/Spring) will be posted to {channel.mention}",
+        await interaction.followup.send(
+            f"✅ {_CHANNEL_LABELS[channel_type]} will be posted to {channel.mention}",
             ephemeral=True,
         )
 
         # Trigger immediate scrape if BOTH channels are now configured
-        if len(summer_channels) > 0:
-            from src.scheduler.tasks import scrape_and_post
-
+        if len(other_channels) > 0:
             await interaction.followup.send(
                 "🔄 Both channels configured! Triggering initial scrape...",
                 ephemeral=True,
@@ -127,14 +194,29 @@ class ConfigCommands(commands.Cog):
     )
     async def view_config(self, interaction: discord.Interaction):
         """View current configuration."""
-        guild_config = self.config_manager.get_guild_config(interaction.guild_id)
-        scrape_interval = self.config_manager.get_scrape_interval()
-        start_timestamp = self.config_manager.get_scrape_start_timestamp()
-        embed = create_config_embed(
-            guild_config, interaction.guild.name, scrape_interval, start_timestamp
+        await interaction.response.defer(ephemeral=True)
+
+        snapshot = self.config_manager.get_guild_snapshot(interaction.guild_id)
+
+        # Reuse the rendered embed while the config and guild name are unchanged
+        cache_key = (
+            self.config_manager.config_version,
+            interaction.guild.name,
+            snapshot.start_timestamp,
         )
+        cached = self._config_embed_cache.get(interaction.guild_id)
+        if cached is not None and cached[0] == cache_key:
+            embed = cached[1]
+        else:
+            embed = create_config_embed(
+                snapshot.guild_config,
+                interaction.guild.name,
+                snapshot.scrape_interval,
+                snapshot.start_timestamp,
+            )
+            self._config_embed_cache[interaction.guild_id] = (cache_key, embed)
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(
         name="scrape_now",
@@ -145,44 +227,59 @@ class ConfigCommands(commands.Cog):
         """Manually trigger a scrape."""
         await interaction.response.defer(ephemeral=True)
 
+        status_message = None
         try:
             # Check if channels are configured
-            summer_channels = self.config_manager.get_all_channels("summer")
-            offseason_channels = self.config_manager.get_all_channels("offseason")
+            channels = self.config_manager.get_all_channels_multi(
+                ["summer", "offseason"]
+            )
 
-            if not summer_channels and not offseason_channels:
+            if not channels["summer"] and not channels["offseason"]:
                 await interaction.followup.send(
                     "⚠️ No channels configured! Use `/set_summer_channel` and `/set_offseason_channel` first.",
                     ephemeral=True,
                 )
                 return
 
-            # Trigger the scrape task with stats
-            from src.scheduler.tasks import scrape_and_post_with_stats
-
-            stats = await scrape_and_post_with_stats(self.bot, self.config_manager)
+            # Start the scrape in its own task, acknowledge it, then wait for stats
+            scrape = asyncio.create_task(
+                scrape_and_post_with_stats(self.bot, self.config_manager)
+            )
+            status_message = await interaction.followup.send(
+                "⏳ Scrape started...", ephemeral=True, wait=True
+            )
+            stats = await scrape
 
             # Build detailed response
-            response = "✅ **Scrape Complete**\n\n"
-            response += "📊 **Results:**\n"
-            response += f"• Summer internships posted: {stats['summer_posted']}\n"
-            response += (
-                f"• Off-season internships posted: {stats['offseason_posted']}\n"
-            )
-            response += f"• Total new listings: {stats['total_new']}\n"
+            parts = [
+                "✅ **Scrape Complete**",
+                "",
+                "📊 **Results:**",
+                f"• Summer internships posted: {stats['summer_posted']}",
+                f"• Off-season internships posted: {stats['offseason_posted']}",
+                f"• Total new listings: {stats['total_new']}",
+            ]
 
             if stats["errors"] > 0:
-                response += f"\n⚠️ {stats['errors']} error(s) occurred while posting (check logs)"
+                parts.append(
+                    f"\n⚠️ {stats['errors']} error(s) occurred while posting (check logs)"
+                )
 
             if stats["total_new"] == 0:
-                response += "\n\n💡 No new internships found (all already posted or filtered by date)"
+                parts.append(
+                    "\n\n💡 No new internships found (all already posted or filtered by date)"
+                )
+
+            response = "\n".join(parts)
 
-            await interaction.followup.send(response, ephemeral=True)
+            await status_message.edit(content=response)
 
         except Exception as e:
-            await interaction.followup.send(
-                f"❌ Error during scrape: {str(e)}", ephemeral=True
-            )
+            error_message = f"❌ Error during scrape: {str(e)}"
+            if status_message:
+                await status_message.edit(content=error_message)
+            else:
+                await interaction.followup.send(error_message, ephemeral=True)
 
     @app_commands.command(
         name="test_scrape",
@@ -194,10 +291,8 @@ class ConfigCommands(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            from src.scraper.github_client import GitHubClient
-
-            # Create client and fetch listings
-            github_client = GitHubClient()
+            # Reuse the bot's shared client to keep its connection pool warm
+            github_client = self.bot.github_client
 
             # Get start timestamp for filtering
             start_timestamp = self.config_manager.get_scrape_start_timestamp()
@@ -205,6 +300,14 @@ class ConfigCommands(commands.Cog):
             # Fetch all listings
             all_listings = await github_client.fetch_listings(start_timestamp)
 
+            if not all_listings.summer and not all_listings.offseason:
+                await interaction.followup.send(
+                    "🔍 **Test Scrape Results**\n"
+                    "No internships found matching your criteria.",
+                    ephemeral=True,
+                )
+                return
+
             # Get the first 5 from each category
             summer_internships = all_listings.summer[:5]
             offseason_internships = all_listings.offseason[:5]
@@ -217,29 +320,17 @@ class ConfigCommands(commands.Cog):
             )
 
             # Build embeds list (Discord allows up to 10 embeds per message)
-            embeds = []
-
-            # Add summer internship embeds
-            for internship in summer_internships:
-                embeds.append(create_internship_embed(internship))
-
-            # Add off-season internship embeds
-            for internship in offseason_internships:
-                embeds.append(create_internship_embed(internship))
-
-            # Send header message first
-            await interaction.followup.send(header, ephemeral=True)
-
-            # Send embeds if we have any
-            if embeds:
-                await interaction.followup.send(embeds=embeds, ephemeral=True)
-            else:
-                await interaction.followup.send(
-                    "No internships found matching your criteria.", ephemeral=True
+            embeds = [
+                create_internship_embed(internship)
+                for internship in itertools.chain(
+                    summer_internships, offseason_internships
                 )
+            ]
 
-            # Close the client session
-            await github_client.close()
+            # Send header and embeds together in one request
+            await interaction.followup.send(
+                content=header, embeds=embeds, ephemeral=True
+            )
 
         except Exception as e:
             await interaction.followup.send(
@@ -258,23 +349,24 @@ class ConfigCommands(commands.Cog):
         hours: app_commands.Range[float, 0.5, 168.0],
     ):
         """Set the scrape interval."""
+        # Acknowledge within Discord's 3s window before doing any work
+        await interaction.response.defer(ephemeral=True)
+
         try:
-            # Update the interval
-            self.config_manager.set_scrape_interval(hours)
+            # Update the interval (config write runs off the event loop)
+            await asyncio.to_thread(self.config_manager.set_scrape_interval, hours)
 
             # Restart the scraper task with new interval
-            from src.scheduler.tasks import get_scraper_cog
-
             scraper_cog = get_scraper_cog(self.bot)
             if scraper_cog:
                 await scraper_cog.restart_scraper(hours)
 
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ Scrape interval updated to {hours} hours. The scheduler has been restarted.",
                 ephemeral=True,
             )
         except Exception as e:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ Error updating interval: {str(e)}", ephemeral=True
             )
 
@@ -290,27 +382,28 @@ class ConfigCommands(commands.Cog):
         days_back: app_commands.Range[int, 1, 365],
     ):
         """Set the start date for scraping internships."""
-        try:
-            import time
-            from datetime import datetime, timedelta
+        # Acknowledge within Discord's 3s window before doing any work
+        await interaction.response.defer(ephemeral=True)
 
+        try:
             # Calculate timestamp
-            start_date = datetime.now() - timedelta(days=days_back)
-            start_timestamp = int(start_date.timestamp())
+            start_timestamp = int(time.time()) - days_back * SECONDS_PER_DAY
 
-            # Update the config
-            self.config_manager.set_scrape_start_timestamp(start_timestamp)
+            # Update the config (write runs off the event loop)
+            await asyncio.to_thread(
+                self.config_manager.set_scrape_start_timestamp, start_timestamp
+            )
 
             # Format date for display
-            date_str = start_date.strftime("%B %d, %Y")
+            date_str = format_timestamp(start_timestamp)
 
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ Start date set to {date_str} ({days_back} days ago).\n"
                 f"The bot will only scrape internships posted after this date.",
                 ephemeral=True,
             )
         except Exception as e:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ Error updating start date: {str(e)}", ephemeral=True
             )
 
@@ -1,9 +1,28 @@
 """Discord embed formatting for internship listings."""
-import discord
+from discord import Color, Embed
 from src.scraper.data_models import Internship
+from src.utils.date_utils import format_timestamp
 
+# Embed colors, built once instead of per embed
+COLOR_SUMMER = Color.gold()
+COLOR_OFFSEASON = Color.blue()
+_STATS_COLOR = Color.green()
+_CONFIG_COLOR = Color.blurple()
 
-def create_internship_embed(internship: Internship) -> discord.Embed:
+# (color, emoji) indexed by Internship.is_summer
+_SEASON_ATTRS = ((COLOR_OFFSEASON, "❄️"), (COLOR_SUMMER, "☀️"))
+
+# Static labels for the configuration embed
+_SUMMER_CHANNEL_LABEL = "☀️ Summer Channel"
+_OFFSEASON_CHANNEL_LABEL = "❄️ Off-Season Channel"
+_NOT_CONFIGURED = "Not configured"
+_NO_CHANNELS_DESCRIPTION = (
+    "No channels configured yet. Use `/set_summer_channel` or "
+    "`/set_offseason_channel` to get started!"
+)
+
+
+def create_internship_embed(internship: Internship) -> Embed:
     """Create a rich embed for an internship listing.
 
     Args:
@@ -13,22 +32,14 @@ def create_internship_embed(internship: Internship) -> discord.Embed:
         Discord Embed object
     """
     # Determine color based on type
-    if internship.is_summer:
-        color = discord.Color.gold()
-        season_emoji = "☀️"
-    else:
-        color = discord.Color.blue()
-        season_emoji = "❄️"
-
-    # Create title with company and role
-    title = f"{internship.company_name} - {internship.title}"
+    color, season_emoji = _SEASON_ATTRS[internship.is_summer]
 
     # Create embed
-    embed = discord.Embed(
-        title=title,
+    embed = Embed(
+        title=internship.display_title,
         url=internship.url,
         color=color,
-        description=f"{season_emoji} {', '.join(internship.terms)}"
+        description=f"{season_emoji} {internship.terms_str}"
     )
 
     # Add fields
@@ -57,7 +68,7 @@ def create_internship_embed(internship: Internship) -> discord.Embed:
     return embed
 
 
-def create_stats_embed(summer_count: int, offseason_count: int) -> discord.Embed:
+def create_stats_embed(summer_count: int, offseason_count: int) -> Embed:
     """Create an embed showing scrape statistics.
 
     Args:
@@ -67,9 +78,9 @@ def create_stats_embed(summer_count: int, offseason_count: int) -> discord.Embed
     Returns:
         Discord Embed object
     """
-    embed = discord.Embed(
+    embed = Embed(
         title="📊 New Internships Found",
-        color=discord.Color.green()
+        color=_STATS_COLOR
     )
 
     embed.add_field(
@@ -87,7 +98,7 @@ def create_stats_embed(summer_count: int, offseason_count: int) -> discord.Embed
     return embed
 
 
-def create_config_embed(guild_config: dict, guild_name: str, scrape_interval: float = None, start_timestamp: int = None) -> discord.Embed:
+def create_config_embed(guild_config: dict, guild_name: str, scrape_interval: float = None, start_timestamp: int = None) -> Embed:
     """Create an embed showing current configuration.
 
     Args:
@@ -99,23 +110,23 @@ def create_config_embed(guild_config: dict, guild_name: str, scrape_interval: fl
     Returns:
         Discord Embed object
     """
-    embed = discord.Embed(
+    embed = Embed(
         title=f"⚙️ Configuration for {guild_name}",
-        color=discord.Color.blurple()
+        color=_CONFIG_COLOR
     )
 
     summer_channel = guild_config.get("summer_channel")
     offseason_channel = guild_config.get("offseason_channel")
 
     embed.add_field(
-        name="☀️ Summer Channel",
-        value=f"<#{summer_channel}>" if summer_channel else "Not configured",
+        name=_SUMMER_CHANNEL_LABEL,
+        value=f"<#{summer_channel}>" if summer_channel else _NOT_CONFIGURED,
         inline=False
     )
 
     embed.add_field(
-        name="❄️ Off-Season Channel",
-        value=f"<#{offseason_channel}>" if offseason_channel else "Not configured",
+        name=_OFFSEASON_CHANNEL_LABEL,
+        value=f"<#{offseason_channel}>" if offseason_channel else _NOT_CONFIGURED,
         inline=False
     )
 
@@ -138,8 +149,7 @@ def create_config_embed(guild_config: dict, guild_name: str, scrape_interval: fl
             inline=False
         )
 
-    from datetime import datetime
-    date_str = datetime.fromtimestamp(start_timestamp).strftime("%B %d, %Y")
+    date_str = format_timestamp(start_timestamp)
     embed.add_field(
         name="📅 Scraping From",
         value=f"Internships posted after {date_str}",
@@ -147,6 +157,6 @@ def create_config_embed(guild_config: dict, guild_name: str, scrape_interval: fl
     )
 
     if not summer_channel and not offseason_channel:
-        embed.description = "No channels configured yet. Use `/set_summer_channel` or `/set_offseason_channel` to get started!"
+        embed.description = _NO_CHANNELS_DESCRIPTION
 
     return embed
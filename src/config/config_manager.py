@@ -1,21 +1,68 @@
 """Manager for bot configuration stored in JSON files."""
 
 import asyncio
-import json
+import pickle
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 from src.config.settings import CONFIG_FILE, LAST_SCRAPE_FILE, SCRAPE_INTERVAL_HOURS
+from src.utils import json_utils
+
+
+@dataclass(frozen=True)
+class GuildSnapshot:
+    """Configuration values needed to describe a guild's setup."""
+
+    # Read-only copy, unaffected by later writes to the config
+    guild_config: Mapping
+    scrape_interval: float
+    start_timestamp: int
 
 
 class ConfigManager:
     """Manages channel mappings and scrape tracking."""
 
-    def __init__(self):
-        self.config_file = CONFIG_FILE
-        self.last_scrape_file = LAST_SCRAPE_FILE
-        self._config_lock = asyncio.Lock()
+    # Default lookback window when no custom start timestamp is set
+    DEFAULT_START_DAYS = 3
+    # How long the computed default start timestamp is reused
+    DEFAULT_START_CACHE_SECONDS = 60.0
+
+    def __init__(
+        self,
+        config_file: Optional[Path] = None,
+        last_scrape_file: Optional[Path] = None,
+    ):
+        """Initialize the manager and create missing data files.
+
+        Args:
+            config_file: Path to the config JSON file (defaults to CONFIG_FILE)
+            last_scrape_file: Path to the scrape tracking file (defaults to
+                LAST_SCRAPE_FILE)
+        """
+        self.config_file = config_file or CONFIG_FILE
+        self.last_scrape_file = last_scrape_file or LAST_SCRAPE_FILE
+        # Setters may run in worker threads (asyncio.to_thread)
+        self._config_lock = threading.Lock()
         self._scrape_lock = asyncio.Lock()
+        # Parsed files are reused until their modification time changes
+        self._config_cache: Optional[Dict] = None
+        self._config_mtime_ns: Optional[int] = None
+        self._last_scrape_cache: Optional[Dict[str, Set[str]]] = None
+        self._last_scrape_mtime_ns: Optional[int] = None
+        # Last JSON payload written per file, with the file's mtime afterwards
+        self._last_written: Dict[Path, Tuple[bytes, int]] = {}
+        # (default start timestamp, time it was computed)
+        self._default_start_ts_cache = (0, 0.0)
+        # Incremented whenever the cached config is reloaded or written
+        self._config_version = 0
+        # Channel IDs per channel type across all guilds, rebuilt with the cache
+        self._channels_by_type: Dict[str, List[int]] = {}
+        # Snapshots built from the current config cache, keyed by guild ID
+        self._snapshot_cache: Dict[int, GuildSnapshot] = {}
         self._ensure_files_exist()
 
     def _ensure_files_exist(self):
@@ -23,29 +70,168 @@ class ConfigManager:
         if not self.config_file.exists():
             self.config_file.write_text('{"global": {}}')
         if not self.last_scrape_file.exists():
-            self.last_scrape_file.write_text('{"summer": [], "offseason": []}')
+            # Migrate IDs from the JSON file used by earlier versions
+            legacy_file = self.last_scrape_file.with_suffix(".json")
+            if legacy_file != self.last_scrape_file and legacy_file.exists():
+                data = self._decode_last_scrape(legacy_file.read_bytes())
+            else:
+                data = {"summer": set(), "offseason": set()}
+            self._atomic_write_bytes(
+                self.last_scrape_file, pickle.dumps(data, protocol=5)
+            )
 
     # Channel Configuration Methods
     def get_config(self) -> Dict:
-        """Load full configuration."""
-        return json.loads(self.config_file.read_text())
+        """Load full configuration.
+
+        Returns:
+            The cached configuration dict (shared, do not mutate)
+        """
+        return self._load()
+
+    def _load(self) -> Dict:
+        """Return the parsed config, reading the file only if it changed.
+
+        The parsed config is cached in memory and only re-read from disk when
+        the file's modification time changes (e.g. after a manual edit).
+        """
+        mtime_ns = self.config_file.stat().st_mtime_ns
+        if self._config_cache is None or mtime_ns != self._config_mtime_ns:
+            self._config_cache = json_utils.loads(self.config_file.read_bytes())
+            self._config_mtime_ns = mtime_ns
+            self._config_version += 1
+            self._snapshot_cache = {}
+            self._rebuild_channel_index(self._config_cache)
+        return self._config_cache
+
+    def _rebuild_channel_index(self, config: Dict):
+        """Index configured channel IDs by channel type.
+
+        Args:
+            config: Full configuration
+        """
+        channels_by_type: Dict[str, List[int]] = {}
+        for guild_config in config.values():
+            for key, value in guild_config.items():
+                if key.endswith("_channel"):
+                    channel_type = key[: -len("_channel")]
+                    channels_by_type.setdefault(channel_type, []).append(value)
+        self._channels_by_type = channels_by_type
+
+    @property
+    def config_version(self) -> int:
+        """Counter that changes whenever the cached configuration may have changed.
+
+        Callers can use it to invalidate values derived from the config.
+        """
+        return self._config_version
+
+    def get_guild_snapshot(self, guild_id: int) -> GuildSnapshot:
+        """Get guild config, scrape interval and start timestamp from one read.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Snapshots are reused until the config cache is reloaded or written,
+        or until the cached default start timestamp is recomputed.
+
+        Returns:
+            GuildSnapshot with the guild's channels and global scrape settings
+        """
+        config = self._load()
+        global_config = config.get("global", {})
+        start_timestamp = self._start_timestamp_from(global_config)
+        snapshot = self._snapshot_cache.get(guild_id)
+        if snapshot is None or snapshot.start_timestamp != start_timestamp:
+            snapshot = GuildSnapshot(
+                guild_config=MappingProxyType(dict(config.get(str(guild_id), {}))),
+                scrape_interval=self._scrape_interval_from(global_config),
+                start_timestamp=start_timestamp,
+            )
+            self._snapshot_cache[guild_id] = snapshot
+        return snapshot
+
+    def _save(self, config: Dict):
+        """Persist configuration and keep it as the in-memory cache.
+
+        Args:
+            config: Full configuration to write
+        """
+        try:
+            self._atomic_write(self.config_file, config)
+        except Exception:
+            # The in-memory dict may no longer match the file; reload next time
+            self._config_cache = None
+            raise
+        else:
+            self._config_cache = config
+            self._config_mtime_ns = self.config_file.stat().st_mtime_ns
+            self._rebuild_channel_index(config)
+        finally:
+            self._config_version += 1
+            self._snapshot_cache = {}
 
     def get_guild_config(self, guild_id: int) -> Dict:
         """Get configuration for a specific guild."""
-        config = self.get_config()
+        config = self._load()
         return config.get(str(guild_id), {})
 
     def _atomic_write(self, file_path: Path, data: Dict):
         """Write data to file atomically using temp file + rename.
 
+        Skips the write if the payload matches what was last written and the
+        file has not been modified since.
+
         Args:
             file_path: Target file path
             data: Data to write as JSON
         """
+        payload = json_utils.dumps(data)
+        last_written = self._last_written.get(file_path)
+        if last_written is not None and last_written == (
+            payload,
+            self._mtime_ns(file_path),
+        ):
+            return
+
+        self._atomic_write_bytes(file_path, payload)
+        self._last_written[file_path] = (payload, file_path.stat().st_mtime_ns)
+
+    @staticmethod
+    def _mtime_ns(file_path: Path) -> Optional[int]:
+        """Get a file's modification time, or None if it does not exist."""
+        try:
+            return file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _atomic_write_bytes(self, file_path: Path, payload: bytes):
+        """Write raw bytes to file atomically using temp file + rename.
+
+        Args:
+            file_path: Target file path
+            payload: Bytes to write
+        """
         temp_file = file_path.with_suffix(".tmp")
-        temp_file.write_text(json.dumps(data, indent=2))
+        temp_file.write_bytes(payload)
         temp_file.replace(file_path)
 
+    def _set_value(self, section: str, key: str, value):
+        """Set one value in a config section and persist it.
+
+        Builds a new top-level dict and section dict rather than editing the
+        cached config, which callers of get_config() may still be reading.
+
+        Args:
+            section: Top-level key (a guild ID or "global")
+            key: Key within the section
+            value: Value to store
+        """
+        with self._config_lock:
+            config = dict(self._load())
+            config[section] = {**config.get(section, {}), key: value}
+            self._save(config)
+
     def set_channel(self, guild_id: int, channel_type: str, channel_id: int):
         """Set a channel for a guild.
 
@@ -54,14 +240,7 @@ class ConfigManager:
             channel_type: Either 'summer' or 'offseason'
             channel_id: Discord channel ID
         """
-        config = self.get_config()
-        guild_key = str(guild_id)
-
-        if guild_key not in config:
-            config[guild_key] = {}
-
-        config[guild_key][f"{channel_type}_channel"] = channel_id
-        self._atomic_write(self.config_file, config)
+        self._set_value(str(guild_id), f"{channel_type}_channel", channel_id)
 
     def get_all_channels(self, channel_type: str) -> list[int]:
         """Get all configured channels of a specific type across all guilds.
@@ -70,41 +249,111 @@ class ConfigManager:
             channel_type: Either 'summer' or 'offseason'
 
         Returns:
-            List of channel IDs
+            List of channel IDs (shared with the cache, do not mutate)
         """
-        config = self.get_config()
-        channels = []
-        key = f"{channel_type}_channel"
+        self._load()
+        return self._channels_by_type.get(channel_type, [])
 
-        for guild_config in config.values():
-            if key in guild_config:
-                channels.append(guild_config[key])
+    def get_all_channels_multi(self, channel_types: List[str]) -> Dict[str, List[int]]:
+        """Get configured channels for several channel types from the channel index.
 
-        return channels
+        Args:
+            channel_types: Channel types to collect, e.g. ['summer', 'offseason']
+
+        Returns:
+            Dict mapping each channel type to its list of channel IDs
+        """
+        self._load()
+        return {
+            channel_type: self._channels_by_type.get(channel_type, [])
+            for channel_type in channel_types
+        }
+
+    def has_all_channel_types(self, channel_types: List[str]) -> bool:
+        """Check whether every channel type has at least one configured channel.
+
+        Args:
+            channel_types: Channel types to check, e.g. ['summer', 'offseason']
+
+        Returns:
+            True if each type is configured in at least one guild
+        """
+        self._load()
+        return all(self._channels_by_type.get(t) for t in channel_types)
 
     # Last Scrape Tracking Methods
     def get_last_scrape(self) -> Dict[str, Set[str]]:
         """Get UUIDs from last scrape.
 
+        The returned sets are cached until the file changes and must not be
+        mutated by callers.
+
         Returns:
             Dict with 'summer' and 'offseason' keys containing sets of UUIDs
         """
-        data = json.loads(self.last_scrape_file.read_text())
-        return {
-            "summer": set(data.get("summer", [])),
-            "offseason": set(data.get("offseason", [])),
-        }
+        mtime_ns = self.last_scrape_file.stat().st_mtime_ns
+        if self._last_scrape_cache is None or mtime_ns != self._last_scrape_mtime_ns:
+            self._last_scrape_cache = self._decode_last_scrape(
+                self.last_scrape_file.read_bytes()
+            )
+            self._last_scrape_mtime_ns = mtime_ns
+        return self._last_scrape_cache
+
+    @staticmethod
+    def _decode_last_scrape(payload: bytes) -> Dict[str, Set[str]]:
+        """Decode last scrape IDs stored as a pickle or as legacy JSON lists.
+
+        Args:
+            payload: Raw file contents
+
+        Returns:
+            Dict with 'summer' and 'offseason' keys containing sets of UUIDs
+        """
+        try:
+            return pickle.loads(payload)
+        except pickle.UnpicklingError:
+            data = json_utils.loads(payload)
+            return {
+                "summer": set(data.get("summer", [])),
+                "offseason": set(data.get("offseason", [])),
+            }
 
     async def update_last_scrape(self, summer_ids: Set[str], offseason_ids: Set[str]):
         """Update last scrape tracking file with atomic write and lock.
 
+        The file write runs in a worker thread so the event loop is not blocked.
+        The given sets are kept as the cache without copying, so callers should
+        pass fresh sets (e.g. from ScrapedData.get_all_ids) and not reuse them.
+
         Args:
             summer_ids: Set of UUIDs for summer internships
             offseason_ids: Set of UUIDs for off-season internships
         """
         async with self._scrape_lock:
-            data = {"summer": list(summer_ids), "offseason": list(offseason_ids)}
-            self._atomic_write(self.last_scrape_file, data)
+            data = {"summer": summer_ids, "offseason": offseason_ids}
+            await asyncio.to_thread(self._write_last_scrape, data)
+
+    def _write_last_scrape(self, data: Dict[str, Set[str]]):
+        """Persist last scrape IDs and keep them as the in-memory cache.
+
+        Nothing is written when the IDs match what is already on disk, which is
+        the common case for scrapes that find no new listings.
+
+        Args:
+            data: Dict with 'summer' and 'offseason' sets of UUIDs
+        """
+        if data == self.get_last_scrape():
+            return
+
+        try:
+            self._atomic_write_bytes(
+                self.last_scrape_file, pickle.dumps(data, protocol=5)
+            )
+        except Exception:
+            self._last_scrape_cache = None
+            raise
+        self._last_scrape_cache = data
+        self._last_scrape_mtime_ns = self.last_scrape_file.stat().st_mtime_ns
 
     # Scrape Interval Methods
     def get_scrape_interval(self) -> float:
@@ -113,8 +362,12 @@ class ConfigManager:
         Returns:
             Scrape interval in hours (default from settings if not set)
         """
-        config = self.get_config()
-        global_config = config.get("global", {})
+        config = self._load()
+        return self._scrape_interval_from(config.get("global", {}))
+
+    @staticmethod
+    def _scrape_interval_from(global_config: Dict) -> float:
+        """Read the scrape interval from the global config section."""
         return global_config.get("scrape_interval_hours", SCRAPE_INTERVAL_HOURS)
 
     def set_scrape_interval(self, hours: float):
@@ -126,12 +379,7 @@ class ConfigManager:
         if hours <= 0:
             raise ValueError("Scrape interval must be greater than 0")
 
-        config = self.get_config()
-        if "global" not in config:
-            config["global"] = {}
-
-        config["global"]["scrape_interval_hours"] = hours
-        self._atomic_write(self.config_file, config)
+        self._set_value("global", "scrape_interval_hours", hours)
 
     # Start Date Methods
     def get_scrape_start_timestamp(self) -> int:
@@ -140,18 +388,22 @@ class ConfigManager:
         Returns:
             Unix timestamp (defaults to 3 days ago if not set)
         """
-        config = self.get_config()
-        global_config = config.get("global", {})
+        config = self._load()
+        return self._start_timestamp_from(config.get("global", {}))
 
+    def _start_timestamp_from(self, global_config: Dict) -> int:
+        """Read the start timestamp from the global config section."""
         # Check if user has set a custom start timestamp
         if "scrape_start_timestamp" in global_config:
             return global_config["scrape_start_timestamp"]
 
-        # Default: 3 days ago
-        from datetime import datetime, timedelta
-
-        default_start = datetime.now() - timedelta(days=3)
-        return int(default_start.timestamp())
+        # Default: 3 days ago, recomputed at most once per cache window
+        now = time.time()
+        cached_ts, computed_at = self._default_start_ts_cache
+        if now - computed_at >= self.DEFAULT_START_CACHE_SECONDS:
+            cached_ts = int(now - self.DEFAULT_START_DAYS * 86400)
+            self._default_start_ts_cache = (cached_ts, now)
+        return cached_ts
 
     def set_scrape_start_timestamp(self, timestamp: int):
         """Set the start timestamp for filtering internships.
@@ -162,9 +414,22 @@ class ConfigManager:
         if timestamp <= 0:
             raise ValueError("Timestamp must be greater than 0")
 
-        config = self.get_config()
-        if "global" not in config:
-            config["global"] = {}
+        self._set_value("global", "scrape_start_timestamp", timestamp)
+
+    # Command Sync Methods
+    def get_command_tree_hash(self) -> Optional[str]:
+        """Get the hash of the command tree that was last synced globally.
+
+        Returns:
+            Hex digest string, or None if commands were never synced
+        """
+        config = self._load()
+        return config.get("global", {}).get("command_tree_hash")
+
+    def set_command_tree_hash(self, tree_hash: str):
+        """Record the hash of the command tree that was just synced globally.
 
-        config["global"]["scrape_start_timestamp"] = timestamp
-        self._atomic_write(self.config_file, config)
+        Args:
+            tree_hash: Hex digest of the synced command tree
+        """
+        self._set_value("global", "command_tree_hash", tree_hash)
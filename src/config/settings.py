@@ -26,4 +26,4 @@ SCRAPE_INTERVAL_HOURS = int(os.getenv("SCRAPE_INTERVAL_HOURS", "6"))
 # File paths
 BASE_DIR = Path(__file__).parent.parent.parent
 CONFIG_FILE = BASE_DIR / "config.json"
-LAST_SCRAPE_FILE = BASE_DIR / "last_scrape.json"
+LAST_SCRAPE_FILE = BASE_DIR / "last_scrape.pkl"
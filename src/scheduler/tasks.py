@@ -1,122 +1,368 @@
 """Background tasks for periodic scraping."""
 
 import asyncio
-from typing import Optional
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
+import discord
 from discord.ext import commands, tasks
 
 from src.bot.embeds import create_internship_embed
 from src.config.config_manager import ConfigManager
-from src.scraper.github_client import GitHubClient
+from src.scraper.data_models import ScrapedData
+from src.utils.date_utils import format_timestamp
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Attempts per message before giving up on repeated 429 responses
+MAX_SEND_RETRIES = 8
+# Discord limits per message: embed count and combined embed text length
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+# Discord's per-channel message rate limit: CHANNEL_RATE_LIMIT sends per period
+CHANNEL_RATE_LIMIT = 5
+CHANNEL_RATE_PERIOD_SECONDS = 5.0
+# Pending posting jobs per channel before submitters wait (backpressure)
+POST_QUEUE_MAXSIZE = 100
 
-async def scrape_and_post(bot: commands.Bot, config_manager: ConfigManager):
-    """Scrape internships and post new ones to configured channels.
+
+class ChannelRateLimiter:
+    """Sliding-window limiter that keeps each channel under Discord's send rate.
+
+    Sends proceed immediately until a channel has used its allowance for the
+    current window; only then does acquire() sleep until the oldest send ages out.
+    """
+
+    def __init__(
+        self,
+        rate: int = CHANNEL_RATE_LIMIT,
+        period: float = CHANNEL_RATE_PERIOD_SECONDS,
+    ):
+        self.rate = rate
+        self.period = period
+        self._sends: Dict[int, Deque[float]] = {}
+
+    async def acquire(self, channel_id: int):
+        """Wait until a message may be sent to the channel and record the send.
+
+        Args:
+            channel_id: Target channel ID
+        """
+        sends = self._sends.setdefault(channel_id, deque())
+        while True:
+            now = time.monotonic()
+            while sends and now - sends[0] >= self.period:
+                sends.popleft()
+            if len(sends) < self.rate:
+                break
+            await asyncio.sleep(self.period - (now - sends[0]))
+        sends.append(now)
+
+
+# Shared by scheduled and manual scrapes so both count against the same window
+_channel_limiter = ChannelRateLimiter()
+
+
+def _batch_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Group embeds into batches that fit in a single message.
+
+    Args:
+        embeds: Embeds in posting order
+
+    Returns:
+        List of batches, each within Discord's per-message embed limits
+    """
+    batches: List[List[discord.Embed]] = []
+    batch: List[discord.Embed] = []
+    batch_chars = 0
+    for embed in embeds:
+        embed_chars = len(embed)
+        if batch and (
+            len(batch) == MAX_EMBEDS_PER_MESSAGE
+            or batch_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(embed)
+        batch_chars += embed_chars
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _send_with_backoff(
+    channel: discord.abc.Messageable,
+    embeds: List[discord.Embed],
+    max_retries: int = MAX_SEND_RETRIES,
+):
+    """Send embeds, waiting out 429 responses instead of pacing every send.
+
+    discord.py already retries most rate limits internally; this handles the
+    429s it gives up on.
+
+    Args:
+        channel: Channel to post to
+        embeds: Embeds to send in one message
+        max_retries: Maximum number of attempts
+    """
+    for attempt in range(1, max_retries + 1):
+        try:
+            return await channel.send(embeds=embeds)
+        except discord.HTTPException as e:
+            if e.status != 429 or attempt == max_retries:
+                raise
+            retry_after = float(e.response.headers.get("Retry-After", 1.0))
+            await asyncio.sleep(retry_after + random.uniform(0, 0.25))
+
+
+def _resolve_channels(
+    bot: commands.Bot, channel_ids: List[int]
+) -> List[discord.abc.Messageable]:
+    """Look up channels in the bot's cache, skipping ones it cannot see.
 
     Args:
         bot: Discord bot instance
-        config_manager: Configuration manager instance
+        channel_ids: Configured channel IDs
+
+    Returns:
+        Channels found in the cache
     """
-    logger.info("Starting scrape...")
+    channels = []
+    missing = []
+    for channel_id in channel_ids:
+        channel = bot.get_channel(channel_id)
+        if channel is None:
+            missing.append(channel_id)
+        else:
+            channels.append(channel)
 
-    # Initialize GitHub client outside try block to ensure cleanup in finally
-    github_client = GitHubClient()
+    if missing:
+        logger.warning("Skipping %d channel(s) not in cache: %s", len(missing), missing)
+    return channels
 
-    try:
-        # Get last scrape data and start timestamp
-        last_scrape = config_manager.get_last_scrape()
-        start_timestamp = config_manager.get_scrape_start_timestamp()
 
-        if start_timestamp:
-            from datetime import datetime
+async def _post_to_channel(
+    channel: discord.abc.Messageable, batches: List[List[discord.Embed]]
+) -> Tuple[int, int]:
+    """Post batches of embeds to a single channel in order, one message each.
 
-            date_str = datetime.fromtimestamp(start_timestamp).strftime("%Y-%m-%d")
-            logger.info(f"Filtering internships posted after {date_str}")
+    Args:
+        channel: Target channel
+        batches: Embed batches from _batch_embeds
 
-        # Fetch new listings
-        new_listings, all_listings = await github_client.get_new_listings(
-            last_scrape, start_timestamp
+    Returns:
+        Tuple of (embeds posted, embeds that failed to post)
+    """
+    channel_id = channel.id
+    posted = 0
+    errors = 0
+    failures: List[Exception] = []
+    for batch in batches:
+        try:
+            await _channel_limiter.acquire(channel_id)
+            await _send_with_backoff(channel, batch)
+            posted += len(batch)
+        except Exception as e:
+            errors += len(batch)
+            failures.append(e)
+
+    # One summary per channel instead of a traceback per failed message
+    if failures:
+        logger.error(
+            "Failed to post %d of %d message(s) to channel %s, last error: %s",
+            len(failures),
+            len(batches),
+            channel_id,
+            failures[-1],
+            exc_info=failures[-1],
         )
 
-        logger.info(f"Found {len(new_listings.summer)} new summer internships")
-        logger.info(f"Found {len(new_listings.offseason)} new off-season internships")
+    return posted, errors
 
-        # Post summer internships
-        summer_channels = config_manager.get_all_channels("summer")
-        for channel_id in summer_channels:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                for internship in new_listings.summer:
-                    embed = create_internship_embed(internship)
-                    try:
-                        await channel.send(embed=embed)
-                        await asyncio.sleep(1)  # Rate limit prevention
-                    except Exception as e:
-                        logger.error(
-                            f"Error posting to channel {channel_id}: {e}", exc_info=True
-                        )
-
-        # Post off-season internships
-        offseason_channels = config_manager.get_all_channels("offseason")
-        for channel_id in offseason_channels:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                for internship in new_listings.offseason:
-                    embed = create_internship_embed(internship)
-                    try:
-                        await channel.send(embed=embed)
-                        await asyncio.sleep(1)  # Rate limit prevention
-                    except Exception as e:
-                        logger.error(
-                            f"Error posting to channel {channel_id}: {e}", exc_info=True
-                        )
-
-        # Update last scrape tracking
-        await config_manager.update_last_scrape(
-            summer_ids=all_listings.get_all_ids("summer"),
-            offseason_ids=all_listings.get_all_ids("offseason"),
-        )
 
-        logger.info("Scrape completed successfully")
+class PosterClosedError(RuntimeError):
+    """Raised for posting jobs dropped because the poster was closed."""
 
-    except Exception as e:
-        logger.error(f"Error during scrape: {e}", exc_info=True)
-        raise
-    finally:
-        await github_client.close()
 
+def _fail_job(future: asyncio.Future):
+    """Mark an unfinished posting job as dropped."""
+    if not future.done():
+        future.set_exception(PosterClosedError("Channel poster closed before posting"))
 
-async def scrape_and_post_with_stats(
-    bot: commands.Bot, config_manager: ConfigManager
+
+class ChannelPoster:
+    """Per-channel posting queues, each drained in order by its own worker task.
+
+    Scrapes submit jobs and get a future back, so they can either wait for the
+    posts to finish or move on while a slow channel catches up.
+    """
+
+    def __init__(self, maxsize: int = POST_QUEUE_MAXSIZE):
+        self.maxsize = maxsize
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+
+    async def submit(
+        self, channel: discord.abc.Messageable, batches: List[List[discord.Embed]]
+    ) -> asyncio.Future:
+        """Queue embed batches for a channel.
+
+        Args:
+            channel: Target channel
+            batches: Embed batches from _batch_embeds
+
+        Returns:
+            Future resolving to (embeds posted, embeds that failed to post)
+        """
+        worker = self._workers.get(channel.id)
+        if worker is None or worker.done():
+            self._queues[channel.id] = asyncio.Queue(maxsize=self.maxsize)
+            self._workers[channel.id] = asyncio.create_task(
+                self._worker(self._queues[channel.id])
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[channel.id].put((channel, batches, future))
+        return future
+
+    async def _worker(self, queue: asyncio.Queue):
+        """Post queued jobs for one channel, one at a time."""
+        while True:
+            channel, batches, future = await queue.get()
+            try:
+                result = await _post_to_channel(channel, batches)
+            except asyncio.CancelledError:
+                _fail_job(future)
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                queue.task_done()
+
+    def close(self):
+        """Cancel all worker tasks and fail every job that has not been posted.
+
+        Submitters waiting on a job get a PosterClosedError instead of hanging.
+        """
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, _, future = queue.get_nowait()
+                _fail_job(future)
+                queue.task_done()
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        self._queues.clear()
+
+
+# Shared by scheduled and manual scrapes so each channel has a single worker
+_poster = ChannelPoster()
+
+# Background scrapes still posting; last_scrape is saved when each finishes
+_pending_scrapes: Set[asyncio.Task] = set()
+
+
+async def _finish_scrape(
+    config_manager: ConfigManager,
+    all_listings: ScrapedData,
+    summer_jobs: List[asyncio.Future],
+    offseason_jobs: List[asyncio.Future],
+    stats: dict,
+):
+    """Wait for a scrape's posting jobs, then record its listings as seen.
+
+    last_scrape is only updated once every job has run, so listings dropped
+    at shutdown are posted by the next scrape instead of being lost.
+
+    Args:
+        config_manager: Configuration manager instance
+        all_listings: Every listing from the scrape, posted or not
+        summer_jobs: Futures from _poster.submit for summer channels
+        offseason_jobs: Futures from _poster.submit for off-season channels
+        stats: Statistics dict updated with posted/error counts
+    """
+    results = await asyncio.gather(
+        *summer_jobs, *offseason_jobs, return_exceptions=True
+    )
+    dropped = [r for r in results if isinstance(r, BaseException)]
+    if dropped:
+        logger.warning(
+            "%d posting job(s) did not run, not updating last scrape: %s",
+            len(dropped),
+            dropped[0],
+        )
+        raise dropped[0]
+
+    for posted, errors in results[: len(summer_jobs)]:
+        stats["summer_posted"] += posted
+        stats["errors"] += errors
+    for posted, errors in results[len(summer_jobs) :]:
+        stats["offseason_posted"] += posted
+        stats["errors"] += errors
+
+    # Update last scrape tracking
+    await config_manager.update_last_scrape(
+        summer_ids=all_listings.get_all_ids("summer"),
+        offseason_ids=all_listings.get_all_ids("offseason"),
+    )
+
+    logger.info(
+        f"Scrape completed: {stats['summer_posted']} summer, {stats['offseason_posted']} offseason posted"
+    )
+
+
+def _on_background_scrape_done(task: asyncio.Task):
+    """Forget a finished background scrape and log why it failed, if it did."""
+    _pending_scrapes.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    # Dropped jobs were already reported by _finish_scrape
+    if error is not None and not isinstance(error, PosterClosedError):
+        logger.error("Error finishing background scrape: %s", error, exc_info=error)
+
+
+async def _scrape_core(
+    bot: commands.Bot, config_manager: ConfigManager, wait: bool = True
 ) -> dict:
-    """Scrape internships and post new ones with statistics tracking.
+    """Scrape internships, post new ones and count what was posted.
 
     Args:
         bot: Discord bot instance
         config_manager: Configuration manager instance
+        wait: Wait for queued posts to finish; if False, posted/error counts
+            are left at 0, posting continues in the background and
+            last_scrape is saved once it is done
 
     Returns:
         Dictionary with statistics: summer_posted, offseason_posted, total_new, errors
     """
-    logger.info("Starting scrape with stats tracking...")
-
     stats = {"summer_posted": 0, "offseason_posted": 0, "total_new": 0, "errors": 0}
 
-    # Initialize GitHub client outside try block to ensure cleanup in finally
-    github_client = GitHubClient()
+    # Listings from an earlier scrape still being posted are not in last_scrape
+    # yet; wait for them so they are not queued a second time
+    if _pending_scrapes:
+        await asyncio.gather(*_pending_scrapes, return_exceptions=True)
+
+    # Reuse the bot's long-lived client so the HTTP connection pool stays warm;
+    # the bot closes it on shutdown
+    github_client = bot.github_client
 
     try:
         # Get last scrape data and start timestamp
-        last_scrape = config_manager.get_last_scrape()
+        last_scrape = await asyncio.to_thread(config_manager.get_last_scrape)
         start_timestamp = config_manager.get_scrape_start_timestamp()
 
         if start_timestamp:
-            from datetime import datetime
-
-            date_str = datetime.fromtimestamp(start_timestamp).strftime("%Y-%m-%d")
+            date_str = format_timestamp(start_timestamp, "%Y-%m-%d")
             logger.info(f"Filtering internships posted after {date_str}")
 
         # Fetch new listings
@@ -129,59 +375,80 @@ async def scrape_and_post_with_stats(
         logger.info(f"Found {len(new_listings.summer)} new summer internships")
         logger.info(f"Found {len(new_listings.offseason)} new off-season internships")
 
-        # Post summer internships
-        summer_channels = config_manager.get_all_channels("summer")
-        for channel_id in summer_channels:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                for internship in new_listings.summer:
-                    embed = create_internship_embed(internship)
-                    try:
-                        await channel.send(embed=embed)
-                        stats["summer_posted"] += 1
-                        await asyncio.sleep(1)  # Rate limit prevention
-                    except Exception as e:
-                        stats["errors"] += 1
-                        logger.error(
-                            f"Error posting to channel {channel_id}: {e}", exc_info=True
-                        )
-
-        # Post off-season internships
-        offseason_channels = config_manager.get_all_channels("offseason")
-        for channel_id in offseason_channels:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                for internship in new_listings.offseason:
-                    embed = create_internship_embed(internship)
-                    try:
-                        await channel.send(embed=embed)
-                        stats["offseason_posted"] += 1
-                        await asyncio.sleep(1)  # Rate limit prevention
-                    except Exception as e:
-                        stats["errors"] += 1
-                        logger.error(
-                            f"Error posting to channel {channel_id}: {e}", exc_info=True
-                        )
-
-        # Update last scrape tracking
-        await config_manager.update_last_scrape(
-            summer_ids=all_listings.get_all_ids("summer"),
-            offseason_ids=all_listings.get_all_ids("offseason"),
-        )
+        # Read both channel lists from one config snapshot and resolve them once
+        channel_ids = config_manager.get_all_channels_multi(["summer", "offseason"])
+        summer_channels = _resolve_channels(bot, channel_ids["summer"])
+        offseason_channels = _resolve_channels(bot, channel_ids["offseason"])
 
-        logger.info(
-            f"Scrape completed: {stats['summer_posted']} summer, {stats['offseason_posted']} offseason posted"
+        # Build and batch each embed once and queue them for every channel;
+        # channels are posted to concurrently by their own workers
+        summer_batches = _batch_embeds(
+            [create_internship_embed(i) for i in new_listings.summer]
         )
+        offseason_batches = _batch_embeds(
+            [create_internship_embed(i) for i in new_listings.offseason]
+        )
+        summer_jobs = [
+            await _poster.submit(c, summer_batches)
+            for c in summer_channels
+            if summer_batches
+        ]
+        offseason_jobs = [
+            await _poster.submit(c, offseason_batches)
+            for c in offseason_channels
+            if offseason_batches
+        ]
+
+        finish = _finish_scrape(
+            config_manager, all_listings, summer_jobs, offseason_jobs, stats
+        )
+        if wait:
+            await finish
+        else:
+            task = asyncio.create_task(finish)
+            _pending_scrapes.add(task)
+            task.add_done_callback(_on_background_scrape_done)
+            logger.info(
+                f"Scrape completed: {stats['total_new']} new internships queued for posting"
+            )
 
     except Exception as e:
-        logger.error(f"Error during scrape: {e}", exc_info=True)
+        logger.error("Error during scrape: %s", e, exc_info=True)
         raise
-    finally:
-        await github_client.close()
 
     return stats
 
 
+async def scrape_and_post(
+    bot: commands.Bot, config_manager: ConfigManager, wait: bool = True
+):
+    """Scrape internships and post new ones to configured channels.
+
+    Args:
+        bot: Discord bot instance
+        config_manager: Configuration manager instance
+        wait: Wait until all new internships are posted before returning
+    """
+    logger.info("Starting scrape...")
+    await _scrape_core(bot, config_manager, wait=wait)
+
+
+async def scrape_and_post_with_stats(
+    bot: commands.Bot, config_manager: ConfigManager
+) -> dict:
+    """Scrape internships and post new ones with statistics tracking.
+
+    Args:
+        bot: Discord bot instance
+        config_manager: Configuration manager instance
+
+    Returns:
+        Dictionary with statistics: summer_posted, offseason_posted, total_new, errors
+    """
+    logger.info("Starting scrape with stats tracking...")
+    return await _scrape_core(bot, config_manager)
+
+
 class ScraperTasks(commands.Cog):
     """Cog for background scraping tasks."""
 
@@ -199,16 +466,15 @@ class ScraperTasks(commands.Cog):
     async def scrape_task(self):
         """Periodic scraping task."""
         # Check if BOTH channel types are configured before scraping
-        summer_channels = self.config_manager.get_all_channels("summer")
-        offseason_channels = self.config_manager.get_all_channels("offseason")
-
-        if not summer_channels or not offseason_channels:
+        if not self.config_manager.has_all_channel_types(["summer", "offseason"]):
             logger.info(
                 "Both summer and offseason channels must be configured. Skipping scheduled scrape"
             )
             return
 
-        await scrape_and_post(self.bot, self.config_manager)
+        # Posting continues in the background so slow channels don't hold up
+        # the loop; per-channel queues keep the order of posts
+        await scrape_and_post(self.bot, self.config_manager, wait=False)
 
     @scrape_task.before_loop
     async def before_scrape_task(self):
@@ -220,6 +486,7 @@ class ScraperTasks(commands.Cog):
     def cog_unload(self):
         """Stop tasks when cog is unloaded."""
         self.scrape_task.cancel()
+        _poster.close()
 
     async def restart_scraper(self, new_interval_hours: float):
         """Restart the scraper task with a new interval.
@@ -1,12 +1,26 @@
 """Data models for internship listings."""
-from datetime import datetime
-from typing import List
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Any, List
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from src.utils.date_utils import format_timestamp
+
+# Season categories, in order of precedence when a listing has several terms
+CATEGORY_SUMMER = 0
+CATEGORY_OFFSEASON = 1
+CATEGORY_OTHER = 2
+
+OFFSEASON_KEYWORDS = ("Fall", "Winter", "Spring")
 
 
 class Internship(BaseModel):
     """Model for a single internship listing."""
 
+    # Listings are never modified after parsing; freezing rejects field
+    # assignment so instances (and their cached display strings) can be
+    # shared between the scraper and posting code
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique UUID for the internship")
     company_name: str
     title: str
@@ -21,25 +35,57 @@ class Internship(BaseModel):
     source: str = ""
     company_url: str = ""
 
+    # Season flags derived from terms once, when the model is built
+    _is_summer: bool = PrivateAttr(default=False)
+    _is_offseason: bool = PrivateAttr(default=False)
+    _category: int = PrivateAttr(default=CATEGORY_OTHER)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Scan terms once and record which seasons the listing belongs to."""
+        is_summer = False
+        is_offseason = False
+        for term in self.terms:
+            if "Summer" in term:
+                is_summer = True
+            if any(keyword in term for keyword in OFFSEASON_KEYWORDS):
+                is_offseason = True
+
+        self._is_summer = is_summer
+        self._is_offseason = is_offseason
+        if is_summer:
+            self._category = CATEGORY_SUMMER
+        elif is_offseason:
+            self._category = CATEGORY_OFFSEASON
+
     @property
     def is_summer(self) -> bool:
         """Check if this is a summer internship."""
-        return any("Summer" in term for term in self.terms)
+        return self._is_summer
 
     @property
     def is_offseason(self) -> bool:
         """Check if this is an off-season internship (Fall/Winter/Spring)."""
-        offseason_keywords = ["Fall", "Winter", "Spring"]
-        return any(
-            keyword in term
-            for term in self.terms
-            for keyword in offseason_keywords
-        )
+        return self._is_offseason
+
+    @property
+    def category(self) -> int:
+        """Get the posting category (summer takes precedence over off-season)."""
+        return self._category
+
+    @cached_property
+    def terms_str(self) -> str:
+        """Get comma-separated terms, computed once per listing."""
+        return ", ".join(self.terms)
+
+    @cached_property
+    def display_title(self) -> str:
+        """Get the 'Company - Role' title, computed once per listing."""
+        return f"{self.company_name} - {self.title}"
 
     @property
     def posted_date_str(self) -> str:
         """Get formatted posted date."""
-        return datetime.fromtimestamp(self.date_posted).strftime("%B %d, %Y")
+        return format_timestamp(self.date_posted)
 
     @property
     def location_str(self) -> str:
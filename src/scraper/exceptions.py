@@ -1,5 +1,7 @@
 """Custom exceptions for the scraper module."""
 
+from typing import Optional
+
 
 class ScraperError(Exception):
     """Base exception for all scraper-related errors."""
@@ -22,7 +24,10 @@ class ParseError(ScraperError):
 class RateLimitError(ScraperError):
     """GitHub API rate limit exceeded."""
 
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds the server asked us to wait, from the Retry-After header
+        self.retry_after = retry_after
 
 
 class NetworkError(ScraperError):
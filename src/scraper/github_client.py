@@ -2,18 +2,46 @@
 
 import asyncio
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import aiohttp
+from pydantic import TypeAdapter, ValidationError
 
 from src.config.settings import GITHUB_REPO_URL, GITHUB_TOKEN
 from src.scraper.data_models import Internship, ScrapedData
 from src.scraper.exceptions import FetchError, NetworkError, ParseError, RateLimitError
+from src.utils import json_utils
 from src.utils.logger import setup_logger
 from src.utils.retry import retry_with_backoff
 
 logger = setup_logger(__name__)
 
+# Connection pool settings for the long-lived session
+CONNECTOR_LIMIT = 20
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 75
+
+# Validates a whole listings payload in one call
+_LISTINGS_ADAPTER = TypeAdapter(List[Internship])
+
+# Returned by _fetch_data when GitHub answers 304 Not Modified
+NOT_MODIFIED = object()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Seconds to wait, or None if the header is missing or not a number
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
 
 class GitHubClient:
     """Client for fetching listings from GitHub."""
@@ -24,18 +52,45 @@ class GitHubClient:
         if GITHUB_TOKEN:
             self.headers["Authorization"] = f"token {GITHUB_TOKEN}"
         self._session: Optional[aiohttp.ClientSession] = None
+        # Validators from the last 200 response, sent back as conditional headers
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        # Listings parsed from the last 200 response, reused on 304
+        self._cached_listings: Optional[ScrapedData] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session with timeout configuration.
 
+        Accept-Encoding is left to aiohttp, which requests gzip/deflate and
+        adds br when the Brotli package (speedups extra) is installed.
+
         Returns:
             ClientSession instance with configured timeout
         """
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=30)  # 30 second timeout
-            self._session = aiohttp.ClientSession(headers=self.headers, timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTOR_LIMIT,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers, timeout=timeout, connector=connector
+            )
         return self._session
 
+    async def warm(self):
+        """Open the HTTP session and prime its connection pool.
+
+        Failures are logged and ignored; the next real fetch will reconnect.
+        """
+        try:
+            session = await self._get_session()
+            async with session.head(self.url) as response:
+                logger.debug(f"Warmed GitHub connection: HTTP {response.status}")
+        except Exception as e:
+            logger.warning(f"Failed to warm GitHub connection: {e}")
+
     async def close(self):
         """Cleanup aiohttp session. Call this when done with the client."""
         if self._session and not self._session.closed:
@@ -50,18 +105,37 @@ class GitHubClient:
         """Async context manager exit - ensures session cleanup."""
         await self.close()
 
-    async def _fetch_data(self) -> List[Dict]:
+    async def _fetch_data(
+        self,
+    ) -> Union[Tuple[List[Dict], Optional[str], Optional[str]], object]:
         """Fetch raw data from GitHub with retries.
 
+        Sends the ETag/Last-Modified of the previous response so an unchanged
+        file costs a 304 with no body.
+
         Returns:
-            List of dictionaries containing internship data
+            Tuple of (internship dictionaries, ETag, Last-Modified), or
+            NOT_MODIFIED if the file is unchanged since the last successful fetch
         """
+        headers = {}
+        if self._cached_listings is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
 
         async def _do_fetch():
             session = await self._get_session()
-            async with session.get(self.url) as response:
-                if response.status == 429:
-                    raise RateLimitError("GitHub API rate limit exceeded")
+            async with session.get(self.url, headers=headers) as response:
+                if response.status == 304:
+                    return NOT_MODIFIED
+                elif response.status == 429:
+                    raise RateLimitError(
+                        "GitHub API rate limit exceeded",
+                        retry_after=_parse_retry_after(
+                            response.headers.get("Retry-After")
+                        ),
+                    )
                 elif response.status >= 500:
                     raise FetchError(f"GitHub server error: HTTP {response.status}")
                 elif response.status != 200:
@@ -69,27 +143,24 @@ class GitHubClient:
                         f"Failed to fetch listings: HTTP {response.status}"
                     )
 
-                # Check content type and parse accordingly
-                content_type = response.headers.get("Content-Type", "")
-                logger.debug(f"Response Content-Type: {content_type}")
+                # GitHub raw URLs often return text/plain even for JSON files, so
+                # always parse the raw bytes instead of branching on Content-Type
+                body = await response.read()
+                logger.debug(f"Received response, length: {len(body)}")
 
                 try:
-                    # GitHub raw URLs often return text/plain even for JSON files
-                    if "application/json" in content_type:
-                        # Direct JSON parsing
-                        data = await response.json()
-                    else:
-                        # Text response (common for raw GitHub URLs) - get text then parse
-                        text = await response.text()
-                        logger.debug(f"Received text response, length: {len(text)}")
-                        data = json.loads(text)
-
-                    return data
+                    data = json_utils.loads(body)
                 except json.JSONDecodeError as e:
                     raise ParseError(f"Invalid JSON response: {e}")
                 except Exception as e:
                     raise ParseError(f"Failed to parse response: {e}")
 
+                return (
+                    data,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+
         try:
             return await retry_with_backoff(
                 _do_fetch,
@@ -97,6 +168,7 @@ class GitHubClient:
                 exceptions=(
                     NetworkError,
                     FetchError,
+                    RateLimitError,
                     asyncio.TimeoutError,
                     aiohttp.ClientError,
                 ),
@@ -109,6 +181,9 @@ class GitHubClient:
     ) -> ScrapedData:
         """Fetch and parse listings from GitHub.
 
+        If the file is unchanged (HTTP 304), listings parsed from the previous
+        response are reused. The returned data may be shared; do not mutate it.
+
         Args:
             start_timestamp: Only include internships posted after this timestamp
 
@@ -117,52 +192,117 @@ class GitHubClient:
         """
         # Fetch data from GitHub with retry logic
         try:
-            data = await self._fetch_data()
+            fetched = await self._fetch_data()
         except asyncio.TimeoutError:
             raise NetworkError("Request timed out after 30 seconds")
 
-        # Parse and categorize internships
-        scraped_data = ScrapedData()
-        entries_processed = 0
-        entries_filtered = 0
+        if fetched is NOT_MODIFIED:
+            logger.info("Listings unchanged since last fetch, reusing parsed data")
+            listings = self._cached_listings
+        else:
+            data, etag, last_modified = fetched
+            # Validation and sorting are CPU-bound; keep them off the event loop
+            listings = await asyncio.to_thread(self._parse_listings, data)
+            # Store the validators with the listings they describe, so a failed
+            # parse never turns the next fetch into a 304 for stale data
+            self._cached_listings = listings
+            self._etag = etag
+            self._last_modified = last_modified
+
+        if not start_timestamp:
+            return listings
+
+        # Filter by date (data is sorted newest first after parsing)
+        scraped_data = ScrapedData(
+            summer=[i for i in listings.summer if i.date_posted >= start_timestamp],
+            offseason=[
+                i for i in listings.offseason if i.date_posted >= start_timestamp
+            ],
+        )
+        entries_filtered = (
+            len(listings.summer)
+            + len(listings.offseason)
+            - len(scraped_data.summer)
+            - len(scraped_data.offseason)
+        )
+        logger.info(
+            f"Filtered {entries_filtered} old entries, "
+            f"found {len(scraped_data.summer)} summer + {len(scraped_data.offseason)} off-season"
+        )
 
-        for item in data:
-            try:
-                internship = Internship(**item)
-                entries_processed += 1
-
-                # Only process active and visible internships
-                if not internship.should_be_posted():
-                    continue
-
-                # Filter by date (but don't break - data is unsorted)
-                if start_timestamp and internship.date_posted < start_timestamp:
-                    entries_filtered += 1
-                    continue  # Skip old entry, keep processing others
-
-                # Categorize by term
-                if internship.is_summer:
-                    scraped_data.summer.append(internship)
-                elif internship.is_offseason:
-                    scraped_data.offseason.append(internship)
-
-            except Exception as e:
-                # Skip invalid entries
-                logger.warning(f"Failed to parse listing: {e}")
+        return scraped_data
+
+    def _parse_listings(self, data: List[Dict]) -> ScrapedData:
+        """Parse raw listings into postable internships grouped by season.
+
+        Args:
+            data: Raw listing dictionaries from GitHub
+
+        Returns:
+            ScrapedData with active, visible listings sorted newest first
+        """
+        scraped_data = ScrapedData()
+        # Lists indexed by Internship.category; other terms are not posted
+        buckets = (scraped_data.summer, scraped_data.offseason, None)
+
+        # Most of the file is inactive or hidden; skip those before paying for
+        # model validation
+        candidates = [
+            item
+            for item in data
+            if isinstance(item, dict) and item.get("active") and item.get("is_visible")
+        ]
+        entries_skipped = len(data) - len(candidates)
+
+        internships = self._validate_listings(candidates)
+        entries_processed = len(internships)
+
+        for internship in internships:
+            # Only process active and visible internships
+            if not internship.should_be_posted():
                 continue
 
+            # Categorize by term
+            bucket = buckets[internship.category]
+            if bucket is not None:
+                bucket.append(internship)
+
         # Sort results by date (newest first) since GitHub data is unsorted
         scraped_data.summer.sort(key=lambda x: x.date_posted, reverse=True)
         scraped_data.offseason.sort(key=lambda x: x.date_posted, reverse=True)
 
         logger.info(
             f"Processed {entries_processed} entries, "
-            f"filtered {entries_filtered} old entries, "
+            f"skipped {entries_skipped} inactive/hidden, "
             f"found {len(scraped_data.summer)} summer + {len(scraped_data.offseason)} off-season"
         )
 
         return scraped_data
 
+    @staticmethod
+    def _validate_listings(items: List[Dict]) -> List[Internship]:
+        """Validate raw listings in bulk, dropping entries that fail validation.
+
+        Args:
+            items: Raw listing dictionaries
+
+        Returns:
+            Internship models for every valid entry, in input order
+        """
+        while True:
+            try:
+                return _LISTINGS_ADAPTER.validate_python(items)
+            except ValidationError as e:
+                errors = e.errors()
+                invalid = {error["loc"][0] for error in errors if error["loc"]}
+                if not invalid:
+                    raise
+                logger.warning(
+                    f"Skipping {len(invalid)} invalid listing(s), "
+                    f"first error: {errors[0]['msg']}"
+                )
+                items = [item for i, item in enumerate(items) if i not in invalid]
+
     async def get_new_listings(
         self, last_scrape_ids: Dict[str, set], start_timestamp: Optional[int] = None
     ) -> tuple[ScrapedData, ScrapedData]:
@@ -178,14 +318,13 @@ class GitHubClient:
         all_listings = await self.fetch_listings(start_timestamp)
 
         # Filter out already-posted listings
-        new_data = ScrapedData()
-
-        for internship in all_listings.summer:
-            if internship.id not in last_scrape_ids.get("summer", set()):
-                new_data.summer.append(internship)
-
-        for internship in all_listings.offseason:
-            if internship.id not in last_scrape_ids.get("offseason", set()):
-                new_data.offseason.append(internship)
+        known_summer = last_scrape_ids.get("summer") or frozenset()
+        known_offseason = last_scrape_ids.get("offseason") or frozenset()
+        new_data = ScrapedData(
+            summer=[i for i in all_listings.summer if i.id not in known_summer],
+            offseason=[
+                i for i in all_listings.offseason if i.id not in known_offseason
+            ],
+        )
 
         return new_data, all_listings
@@ -0,0 +1,21 @@
+"""Date formatting helpers."""
+
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def format_timestamp(timestamp: int, fmt: str = "%B %d, %Y") -> str:
+    """Format a Unix timestamp as a local date string.
+
+    Results are cached since the same timestamps (the scrape start date,
+    listing post dates) are formatted on every scrape and command.
+
+    Args:
+        timestamp: Unix timestamp
+        fmt: strftime format string
+
+    Returns:
+        Formatted date string
+    """
+    return datetime.fromtimestamp(timestamp).strftime(fmt)
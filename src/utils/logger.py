@@ -1,26 +1,24 @@
 """Logging configuration for the bot."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 
+# Records are queued by the calling thread and written by a background listener,
+# so logging never blocks the event loop on stdout or disk I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
 
-def setup_logger(name: str) -> logging.Logger:
-    """Configure structured logging with console and file output.
 
-    Args:
-        name: Logger name (usually __name__)
-
-    Returns:
-        Configured logger instance
-    """
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-
-    # Prevent duplicate handlers if called multiple times
-    if logger.handlers:
-        return logger
+def _start_listener():
+    """Start the shared background listener that owns the real handlers."""
+    global _listener
+    if _listener is not None:
+        return
 
     # Console handler - outputs to stdout
     console_handler = logging.StreamHandler(sys.stdout)
@@ -44,7 +42,31 @@ def setup_logger(name: str) -> logging.Logger:
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    _listener = QueueListener(
+        _log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    # Flush queued records on interpreter shutdown
+    atexit.register(_listener.stop)
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """Configure structured logging with console and file output.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        Configured logger instance
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+
+    # Prevent duplicate handlers if called multiple times
+    if logger.handlers:
+        return logger
+
+    _start_listener()
+    logger.addHandler(QueueHandler(_log_queue))
 
     return logger
@@ -1,6 +1,7 @@
 """Retry logic with exponential backoff for network operations."""
 
 import asyncio
+import random
 from typing import Callable, Type, TypeVar
 
 from src.utils.logger import setup_logger
@@ -16,8 +17,13 @@ async def retry_with_backoff(
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions: tuple[Type[Exception], ...] = (Exception,),
+    max_delay: float = 60.0,
 ) -> T:
-    """Retry an async function with exponential backoff.
+    """Retry an async function with exponential backoff and full jitter.
+
+    Each wait is a random duration up to the current backoff delay, so
+    clients that failed together don't retry in lockstep. If the exception
+    carries a ``retry_after`` value (e.g. RateLimitError), that is used instead.
 
     Args:
         func: Async function to retry
@@ -25,6 +31,7 @@ async def retry_with_backoff(
         initial_delay: Initial delay in seconds before first retry
         backoff_factor: Multiplier for delay after each retry
         exceptions: Tuple of exception types to catch and retry
+        max_delay: Upper bound in seconds for any single wait
 
     Returns:
         Result from the function
@@ -41,11 +48,16 @@ async def retry_with_backoff(
         except exceptions as e:
             last_exception = e
             if attempt < max_retries - 1:
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None:
+                    wait = min(retry_after, max_delay)
+                else:
+                    wait = random.uniform(0, min(delay, max_delay))
                 logger.warning(
                     f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
-                    f"Retrying in {delay:.1f}s..."
+                    f"Retrying in {wait:.1f}s..."
                 )
-                await asyncio.sleep(delay)
+                await asyncio.sleep(wait)
                 delay *= backoff_factor
             else:
                 logger.error(f"All {max_retries} attempts failed")
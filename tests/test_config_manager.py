@@ -1,9 +1,8 @@
 """Tests for ConfigManager."""
 
-import json
-import tempfile
-from datetime import datetime, timedelta
-from pathlib import Path
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -17,16 +16,11 @@ def temp_config_dir(tmp_path):
 
 
 @pytest.fixture
-def config_manager(temp_config_dir, monkeypatch):
+def config_manager(temp_config_dir):
     """Create ConfigManager with temporary files."""
-    config_file = temp_config_dir / "config.json"
-    last_scrape_file = temp_config_dir / "last_scrape.json"
-
-    # Monkey patch the file paths
-    monkeypatch.setattr("src.config.config_manager.CONFIG_FILE", config_file)
-    monkeypatch.setattr("src.config.config_manager.LAST_SCRAPE_FILE", last_scrape_file)
-
-    return ConfigManager()
+    return ConfigManager(
+        temp_config_dir / "config.json", temp_config_dir / "last_scrape.pkl"
+    )
 
 
 class TestConfigManagerInitialization:
@@ -35,7 +29,7 @@ class TestConfigManagerInitialization:
     def test_creates_config_files(self, config_manager, temp_config_dir):
         """Test that config files are created on init."""
         config_file = temp_config_dir / "config.json"
-        last_scrape_file = temp_config_dir / "last_scrape.json"
+        last_scrape_file = temp_config_dir / "last_scrape.pkl"
 
         assert config_file.exists()
         assert last_scrape_file.exists()
@@ -46,7 +40,7 @@ class TestConfigManagerInitialization:
         assert "global" in config
 
     def test_last_scrape_file_has_default_structure(self, config_manager):
-        """Test that last_scrape.json has correct default structure."""
+        """Test that last_scrape.pkl has correct default structure."""
         last_scrape = config_manager.get_last_scrape()
         assert "summer" in last_scrape
         assert "offseason" in last_scrape
@@ -120,16 +114,28 @@ class TestScrapeInterval:
 class TestStartDate:
     """Test start date/timestamp methods."""
 
-    def test_get_default_start_timestamp(self, config_manager):
-        """Test getting default start timestamp (1 days ago)."""
+    def test_get_default_start_timestamp(self, config_manager, monkeypatch):
+        """Test getting default start timestamp (3 days ago)."""
+        now = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        monkeypatch.setattr(
+            "src.config.config_manager.time.time", lambda: now.timestamp()
+        )
+
         timestamp = config_manager.get_scrape_start_timestamp()
 
-        # Should be approximately 3 days ago
-        three_days_ago = datetime.now() - timedelta(days=1)
-        timestamp_date = datetime.fromtimestamp(timestamp)
+        assert timestamp == int((now - timedelta(days=3)).timestamp())
+
+    def test_default_start_timestamp_is_cached(self, config_manager, monkeypatch):
+        """Test that the default start timestamp is reused for a minute."""
+        now = 1_700_000_000.0
+        monkeypatch.setattr("src.config.config_manager.time.time", lambda: now)
+        first = config_manager.get_scrape_start_timestamp()
 
-        # Allow 1 minute tolerance for test execution time
-        assert abs((timestamp_date - three_days_ago).total_seconds()) < 60
+        now += 30
+        assert config_manager.get_scrape_start_timestamp() == first
+
+        now += 31
+        assert config_manager.get_scrape_start_timestamp() == first + 61
 
     def test_set_custom_start_timestamp(self, config_manager):
         """Test setting custom start timestamp."""
@@ -156,29 +162,188 @@ class TestLastScrapeTracking:
         summer_ids = {"uuid1", "uuid2", "uuid3"}
         offseason_ids = {"uuid4", "uuid5"}
 
-        config_manager.update_last_scrape(summer_ids, offseason_ids)
+        asyncio.run(config_manager.update_last_scrape(summer_ids, offseason_ids))
 
         last_scrape = config_manager.get_last_scrape()
         assert last_scrape["summer"] == summer_ids
         assert last_scrape["offseason"] == offseason_ids
 
-    def test_last_scrape_persists(self, config_manager, temp_config_dir, monkeypatch):
+    def test_last_scrape_persists(self, config_manager):
         """Test that last scrape data persists across instances."""
         summer_ids = {"uuid1", "uuid2"}
         offseason_ids = {"uuid3"}
 
-        config_manager.update_last_scrape(summer_ids, offseason_ids)
+        asyncio.run(config_manager.update_last_scrape(summer_ids, offseason_ids))
 
         # Create new instance (simulating restart)
-        config_file = temp_config_dir / "config.json"
-        last_scrape_file = temp_config_dir / "last_scrape.json"
-        monkeypatch.setattr("src.config.config_manager.CONFIG_FILE", config_file)
-        monkeypatch.setattr(
-            "src.config.config_manager.LAST_SCRAPE_FILE", last_scrape_file
+        new_manager = ConfigManager(
+            config_manager.config_file, config_manager.last_scrape_file
         )
-
-        new_manager = ConfigManager()
         last_scrape = new_manager.get_last_scrape()
 
         assert last_scrape["summer"] == summer_ids
         assert last_scrape["offseason"] == offseason_ids
+
+    def test_unchanged_ids_skip_write(self, config_manager):
+        """Test that rewriting the same IDs leaves the file untouched."""
+        asyncio.run(config_manager.update_last_scrape({"uuid1"}, {"uuid2"}))
+        mtime_ns = config_manager.last_scrape_file.stat().st_mtime_ns
+
+        asyncio.run(config_manager.update_last_scrape({"uuid1"}, {"uuid2"}))
+
+        assert config_manager.last_scrape_file.stat().st_mtime_ns == mtime_ns
+
+    def test_migrates_legacy_json(self, temp_config_dir):
+        """Test that IDs from a legacy last_scrape.json are carried over."""
+        legacy_file = temp_config_dir / "last_scrape.json"
+        legacy_file.write_text('{"summer": ["uuid1"], "offseason": ["uuid2"]}')
+
+        last_scrape = ConfigManager(
+            temp_config_dir / "config.json", temp_config_dir / "last_scrape.pkl"
+        ).get_last_scrape()
+
+        assert last_scrape == {"summer": {"uuid1"}, "offseason": {"uuid2"}}
+
+
+class TestConfigCache:
+    """Test in-memory config caching."""
+
+    def test_get_config_is_cached(self, config_manager):
+        """Test that repeated reads are served from the cache."""
+        assert config_manager.get_config() is config_manager.get_config()
+
+    def test_write_invalidates_cache(self, config_manager):
+        """Test that writes are visible to subsequent reads."""
+        config_manager.get_config()
+        config_manager.set_channel(123, "summer", 456)
+
+        assert config_manager.get_guild_config(123)["summer_channel"] == 456
+
+    def test_writes_do_not_mutate_returned_config(self, config_manager):
+        """Test that dicts returned before a write are left unchanged."""
+        config_manager.set_channel(123, "summer", 456)
+        config = config_manager.get_config()
+        guild_config = config_manager.get_guild_config(123)
+
+        config_manager.set_channel(123, "offseason", 789)
+        config_manager.set_scrape_interval(2)
+
+        assert guild_config == {"summer_channel": 456}
+        assert "scrape_interval_hours" not in config["global"]
+        assert config_manager.get_guild_config(123)["offseason_channel"] == 789
+        assert config_manager.get_scrape_interval() == 2
+
+    def test_external_edit_reloads_config(self, config_manager):
+        """Test that a changed modification time triggers a reload."""
+        config_manager.get_config()
+        config_manager.config_file.write_text('{"global": {"scrape_interval_hours": 4}}')
+        mtime_ns = config_manager.config_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_manager.config_file, ns=(mtime_ns, mtime_ns))
+
+        assert config_manager.get_scrape_interval() == 4
+
+    def test_last_scrape_is_cached(self, config_manager):
+        """Test that last scrape IDs are reused until the file changes."""
+        assert config_manager.get_last_scrape() is config_manager.get_last_scrape()
+
+
+class TestGuildSnapshot:
+    """Test combined guild snapshot reads."""
+
+    def test_snapshot_matches_individual_getters(self, config_manager):
+        """Test that the snapshot returns the same values as the getters."""
+        config_manager.set_channel(123, "summer", 456)
+        config_manager.set_scrape_interval(2.5)
+        config_manager.set_scrape_start_timestamp(1700000000)
+
+        snapshot = config_manager.get_guild_snapshot(123)
+
+        assert snapshot.guild_config == config_manager.get_guild_config(123)
+        assert snapshot.scrape_interval == 2.5
+        assert snapshot.start_timestamp == 1700000000
+
+    def test_snapshot_unknown_guild(self, config_manager):
+        """Test snapshot for a guild without configuration."""
+        snapshot = config_manager.get_guild_snapshot(999999)
+        assert snapshot.guild_config == {}
+
+    def test_snapshot_is_not_changed_by_writes(self, config_manager):
+        """Test that a held snapshot keeps its values after a config write."""
+        config_manager.set_channel(123, "summer", 456)
+        snapshot = config_manager.get_guild_snapshot(123)
+
+        config_manager.set_channel(123, "offseason", 789)
+
+        assert dict(snapshot.guild_config) == {"summer_channel": 456}
+        with pytest.raises(TypeError):
+            snapshot.guild_config["summer_channel"] = 1
+
+    def test_snapshot_is_reused_until_write(self, config_manager):
+        """Test that snapshots are cached and invalidated by writes."""
+        first = config_manager.get_guild_snapshot(123)
+        assert config_manager.get_guild_snapshot(123) is first
+
+        config_manager.set_channel(123, "offseason", 789)
+
+        updated = config_manager.get_guild_snapshot(123)
+        assert updated is not first
+        assert updated.guild_config["offseason_channel"] == 789
+
+
+class TestCommandTreeHash:
+    """Test command sync hash tracking."""
+
+    def test_default_command_tree_hash(self, config_manager):
+        """Test that no hash is stored before the first sync."""
+        assert config_manager.get_command_tree_hash() is None
+
+    def test_set_command_tree_hash(self, config_manager):
+        """Test storing the synced command tree hash."""
+        config_manager.set_command_tree_hash("abc123")
+        assert config_manager.get_command_tree_hash() == "abc123"
+
+
+class TestGetAllChannelsMulti:
+    """Test collecting several channel types at once."""
+
+    def test_get_all_channels_multi(self, config_manager):
+        """Test that each type gets only its own channels."""
+        config_manager.set_channel(111, "summer", 1001)
+        config_manager.set_channel(111, "offseason", 1002)
+        config_manager.set_channel(222, "summer", 2001)
+
+        channels = config_manager.get_all_channels_multi(["summer", "offseason"])
+
+        assert sorted(channels["summer"]) == [1001, 2001]
+        assert channels["offseason"] == [1002]
+
+    def test_get_all_channels_multi_empty(self, config_manager):
+        """Test result when nothing is configured."""
+        channels = config_manager.get_all_channels_multi(["summer", "offseason"])
+        assert channels == {"summer": [], "offseason": []}
+
+    def test_has_all_channel_types(self, config_manager):
+        """Test that every requested type must have a channel."""
+        config_manager.set_channel(111, "summer", 1001)
+        assert not config_manager.has_all_channel_types(["summer", "offseason"])
+
+        config_manager.set_channel(222, "offseason", 2002)
+        assert config_manager.has_all_channel_types(["summer", "offseason"])
+
+
+class TestConfigVersion:
+    """Test config version tracking."""
+
+    def test_version_stable_between_reads(self, config_manager):
+        """Test that cached reads don't change the version."""
+        config_manager.get_config()
+        version = config_manager.config_version
+        config_manager.get_config()
+        assert config_manager.config_version == version
+
+    def test_version_changes_on_write(self, config_manager):
+        """Test that writes bump the version."""
+        config_manager.get_config()
+        version = config_manager.config_version
+        config_manager.set_scrape_interval(2)
+        assert config_manager.config_version != version
@@ -1,13 +1,35 @@
 """Tests for data models."""
 import pytest
-from datetime import datetime
-from src.scraper.data_models import Internship, ScrapedData
+from pydantic import ValidationError
+from src.scraper.data_models import (
+    CATEGORY_OFFSEASON,
+    CATEGORY_SUMMER,
+    Internship,
+    ScrapedData,
+)
+
+# Minimal valid listing; tests override only the fields they care about
+_BASE_INTERNSHIP = {
+    "id": "test-uuid",
+    "company_name": "Test",
+    "title": "Test Intern",
+    "locations": ["Remote"],
+    "terms": ["Summer 2026"],
+    "sponsorship": "",
+    "active": True,
+    "is_visible": True,
+    "url": "https://test.com",
+    "date_posted": 1700000000,
+    "date_updated": 1700000000,
+    "source": "test",
+    "company_url": "",
+}
 
 
 class TestInternshipModel:
     """Test Internship Pydantic model."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_summer_internship(self):
         """Create a sample summer internship."""
         return {
@@ -26,7 +48,7 @@ class TestInternshipModel:
             "company_url": "https://google.com"
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_offseason_internship(self):
         """Create a sample off-season internship."""
         return {
@@ -54,91 +76,63 @@ class TestInternshipModel:
         assert internship.title == "Software Engineering Intern"
         assert len(internship.locations) == 2
 
+    def test_internship_is_immutable(self, sample_summer_internship):
+        """Test that Internship fields cannot be reassigned."""
+        internship = Internship(**sample_summer_internship)
+        with pytest.raises(ValidationError):
+            internship.active = False
+
     def test_is_summer_property(self, sample_summer_internship):
         """Test is_summer property."""
         internship = Internship(**sample_summer_internship)
         assert internship.is_summer is True
 
-    def test_is_summer_property_multiple_terms(self):
-        """Test is_summer with multiple terms including summer."""
-        data = {
-            "id": "test-uuid",
-            "company_name": "Test",
-            "title": "Test Intern",
-            "locations": ["Remote"],
-            "terms": ["Summer 2026", "Summer 2027"],
-            "sponsorship": "",
-            "active": True,
-            "is_visible": True,
-            "url": "https://test.com",
-            "date_posted": 1700000000,
-            "date_updated": 1700000000,
-            "source": "test",
-            "company_url": ""
-        }
-        internship = Internship(**data)
-        assert internship.is_summer is True
-
     def test_is_offseason_fall(self, sample_offseason_internship):
         """Test is_offseason property with Fall."""
         internship = Internship(**sample_offseason_internship)
         assert internship.is_offseason is True
 
-    def test_is_offseason_winter(self):
-        """Test is_offseason property with Winter."""
-        data = {
-            "id": "test-uuid",
-            "company_name": "Test",
-            "title": "Test Intern",
-            "locations": ["Remote"],
-            "terms": ["Winter 2026"],
-            "sponsorship": "",
-            "active": True,
-            "is_visible": True,
-            "url": "https://test.com",
-            "date_posted": 1700000000,
-            "date_updated": 1700000000,
-            "source": "test",
-            "company_url": ""
-        }
-        internship = Internship(**data)
-        assert internship.is_offseason is True
-
-    def test_is_offseason_spring(self):
-        """Test is_offseason property with Spring."""
-        data = {
-            "id": "test-uuid",
-            "company_name": "Test",
-            "title": "Test Intern",
-            "locations": ["Remote"],
-            "terms": ["Spring 2027"],
-            "sponsorship": "",
-            "active": True,
-            "is_visible": True,
-            "url": "https://test.com",
-            "date_posted": 1700000000,
-            "date_updated": 1700000000,
-            "source": "test",
-            "company_url": ""
-        }
+    @pytest.mark.parametrize(
+        "terms, is_summer, is_offseason",
+        [
+            (["Winter 2026"], False, True),
+            (["Spring 2027"], False, True),
+            (["Summer 2026", "Summer 2027"], True, False),
+        ],
+    )
+    def test_season_flags(self, terms, is_summer, is_offseason):
+        """Test is_summer/is_offseason for various terms."""
+        internship = Internship.model_construct(**{**_BASE_INTERNSHIP, "terms": terms})
+        assert internship.is_summer is is_summer
+        assert internship.is_offseason is is_offseason
+
+    def test_category(self, sample_summer_internship, sample_offseason_internship):
+        """Test that category is derived from terms, preferring summer."""
+        assert Internship(**sample_summer_internship).category == CATEGORY_SUMMER
+        assert Internship(**sample_offseason_internship).category == CATEGORY_OFFSEASON
+
+        data = {**sample_summer_internship, "terms": ["Summer 2026", "Fall 2026"]}
         internship = Internship(**data)
-        assert internship.is_offseason is True
+        assert internship.is_summer and internship.is_offseason
+        assert internship.category == CATEGORY_SUMMER
 
     def test_should_be_posted_active_visible(self, sample_summer_internship):
         """Test should_be_posted when active and visible."""
-        internship = Internship(**sample_summer_internship)
+        internship = Internship.model_construct(**sample_summer_internship)
         assert internship.should_be_posted() is True
 
     def test_should_be_posted_inactive(self, sample_summer_internship):
         """Test should_be_posted when inactive."""
-        sample_summer_internship["active"] = False
-        internship = Internship(**sample_summer_internship)
+        internship = Internship.model_construct(
+            **{**sample_summer_internship, "active": False}
+        )
         assert internship.should_be_posted() is False
 
     def test_should_be_posted_not_visible(self, sample_summer_internship):
         """Test should_be_posted when not visible."""
-        sample_summer_internship["is_visible"] = False
-        internship = Internship(**sample_summer_internship)
+        internship = Internship.model_construct(
+            **{**sample_summer_internship, "is_visible": False}
+        )
         assert internship.should_be_posted() is False
 
     def test_posted_date_str(self, sample_summer_internship):
@@ -163,10 +157,17 @@ class TestInternshipModel:
 
     def test_location_str_no_location(self, sample_summer_internship):
         """Test location_str with no locations."""
-        sample_summer_internship["locations"] = []
-        internship = Internship(**sample_summer_internship)
+        data = {**sample_summer_internship, "locations": []}
+        internship = Internship(**data)
         assert internship.location_str == "Location not specified"
 
+    def test_display_strings(self, sample_summer_internship):
+        """Test precomputed title and terms strings on a frozen model."""
+        internship = Internship(**sample_summer_internship)
+        assert internship.display_title == "Google - Software Engineering Intern"
+        assert internship.terms_str == "Summer 2026"
+        assert internship.display_title is internship.display_title
+
 
 class TestScrapedDataModel:
     """Test ScrapedData model."""
@@ -181,35 +182,11 @@ class TestScrapedDataModel:
         """Test get_all_ids for summer internships."""
         data = ScrapedData()
         data.summer = [
-            Internship(
-                id="uuid1",
-                company_name="Test1",
-                title="Test",
-                locations=["Remote"],
-                terms=["Summer 2026"],
-                sponsorship="",
-                active=True,
-                is_visible=True,
-                url="https://test.com",
-                date_posted=1700000000,
-                date_updated=1700000000,
-                source="test",
-                company_url=""
+            Internship.model_construct(
+                **{**_BASE_INTERNSHIP, "id": "uuid1", "terms": ["Summer 2026"]}
             ),
-            Internship(
-                id="uuid2",
-                company_name="Test2",
-                title="Test",
-                locations=["Remote"],
-                terms=["Summer 2026"],
-                sponsorship="",
-                active=True,
-                is_visible=True,
-                url="https://test.com",
-                date_posted=1700000000,
-                date_updated=1700000000,
-                source="test",
-                company_url=""
+            Internship.model_construct(
+                **{**_BASE_INTERNSHIP, "id": "uuid2", "terms": ["Summer 2026"]}
             )
         ]
 
@@ -220,20 +197,8 @@ class TestScrapedDataModel:
         """Test get_all_ids for offseason internships."""
         data = ScrapedData()
         data.offseason = [
-            Internship(
-                id="uuid3",
-                company_name="Test3",
-                title="Test",
-                locations=["Remote"],
-                terms=["Fall 2025"],
-                sponsorship="",
-                active=True,
-                is_visible=True,
-                url="https://test.com",
-                date_posted=1700000000,
-                date_updated=1700000000,
-                source="test",
-                company_url=""
+            Internship.model_construct(
+                **{**_BASE_INTERNSHIP, "id": "uuid3", "terms": ["Fall 2025"]}
             )
         ]
 
@@ -1,11 +1,14 @@
 """Tests for GitHubClient."""
+import json
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.scraper.github_client import GitHubClient
-from src.scraper.data_models import Internship, ScrapedData
+from src.scraper.data_models import ScrapedData
+from src.scraper.exceptions import RateLimitError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_listings_data():
     """Sample listings.json data."""
     return [
@@ -91,117 +94,136 @@ class MockResponse:
     """Mock response object for aiohttp."""
     def __init__(self, json_data, status=200):
         self.status = status
-        self._json_data = json_data
+        self.headers = {}
+        self.set_json(json_data)
 
-    async def json(self):
-        return self._json_data
+    def set_json(self, json_data):
+        """Replace the body returned by read() and json()."""
+        self.read = AsyncMock(return_value=json.dumps(json_data).encode())
+        self.json = AsyncMock(return_value=json_data)
 
 
-def create_mock_session(json_data, status=200):
-    """Helper to create properly mocked aiohttp session."""
-    mock_response = MockResponse(json_data, status)
+class MockSessionFactory:
+    """Mocked aiohttp session built once and reused with different payloads."""
+    def __init__(self):
+        self.response = MockResponse([])
 
-    # __aexit__ must be an async function that accepts (exc_type, exc_val, exc_tb)
-    # and returns False/None to propagate exceptions
-    async def mock_aexit(*args):
-        return None  # Don't suppress exceptions
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=self.response)
+        # Returning None from __aexit__ propagates exceptions
+        request_context.__aexit__ = AsyncMock(return_value=None)
 
-    mock_get = AsyncMock()
-    mock_get.__aenter__.return_value = mock_response
-    mock_get.__aexit__ = mock_aexit
+        self.session = MagicMock()
+        self.session.closed = False
+        self.session.get = MagicMock(return_value=request_context)
+        self.session.close = AsyncMock()
 
-    mock_session_instance = AsyncMock()
-    mock_session_instance.get = MagicMock(return_value=mock_get)
+    def set_payload(self, json_data, status=200, headers=None):
+        """Set the body, status and headers returned by the next request."""
+        self.response.set_json(json_data)
+        self.response.status = status
+        self.response.headers = headers or {}
 
-    mock_session = AsyncMock()
-    mock_session.__aenter__.return_value = mock_session_instance
-    mock_session.__aexit__ = mock_aexit
+    def last_request_headers(self):
+        """Headers passed to the most recent session.get call."""
+        return self.session.get.call_args.kwargs["headers"]
 
-    return mock_session
+
+@pytest.fixture(scope="module")
+def mock_session_factory():
+    """Shared mocked aiohttp session for the whole module."""
+    return MockSessionFactory()
+
+
+@pytest.fixture(autouse=True, scope="class")
+def _patch_client_session(mock_session_factory):
+    """Route every GitHubClient in a test class to the shared mock session."""
+    patcher = patch('aiohttp.ClientSession', return_value=mock_session_factory.session)
+    patcher.start()
+    yield
+    patcher.stop()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def prefetched_scraped_data(sample_listings_data, mock_session_factory):
+    """Listings parsed once from sample_listings_data without a date filter."""
+    mock_session_factory.set_payload(sample_listings_data)
+    with patch('aiohttp.ClientSession', return_value=mock_session_factory.session):
+        client = GitHubClient()
+        result = await client.fetch_listings()
+        await client.close()
+    return result
 
 
 class TestGitHubClientFetchListings:
     """Test GitHubClient fetch_listings method."""
 
-    @pytest.mark.asyncio
-    async def test_fetch_listings_success(self, sample_listings_data):
+    def test_fetch_listings_success(self, prefetched_scraped_data):
         """Test successfully fetching listings."""
-        mock_session = create_mock_session(sample_listings_data)
+        result = prefetched_scraped_data
 
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = GitHubClient()
-            result = await client.fetch_listings()
-
-            assert isinstance(result, ScrapedData)
-            # Without date filter, gets all active/visible: summer-1, summer-2, old-1
-            assert len(result.summer) == 3
-            assert len(result.offseason) == 1  # offseason-1
-            # inactive-1 should be filtered out (not active)
+        assert isinstance(result, ScrapedData)
+        # Without date filter, gets all active/visible: summer-1, summer-2, old-1
+        assert len(result.summer) == 3
+        assert len(result.offseason) == 1  # offseason-1
+        # inactive-1 should be filtered out (not active)
 
     @pytest.mark.asyncio
-    async def test_fetch_listings_with_date_filter(self, sample_listings_data):
+    async def test_fetch_listings_with_date_filter(
+        self, sample_listings_data, mock_session_factory
+    ):
         """Test fetching listings with start_timestamp filter."""
         start_timestamp = 1731850000  # After offseason-1, before summer-2
 
-        mock_session = create_mock_session(sample_listings_data)
+        mock_session_factory.set_payload(sample_listings_data)
 
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = GitHubClient()
-            result = await client.fetch_listings(start_timestamp=start_timestamp)
+        client = GitHubClient()
+        result = await client.fetch_listings(start_timestamp=start_timestamp)
 
-            # Should only get entries newer than start_timestamp
-            assert len(result.summer) == 2  # summer-1, summer-2
-            assert len(result.offseason) == 0  # offseason-1 is too old
+        # Should only get entries newer than start_timestamp
+        assert len(result.summer) == 2  # summer-1, summer-2
+        assert len(result.offseason) == 0  # offseason-1 is too old
 
     @pytest.mark.asyncio
-    async def test_fetch_listings_http_error(self):
+    async def test_fetch_listings_http_error(self, mock_session_factory):
         """Test handling HTTP errors."""
-        mock_session = create_mock_session([], status=404)
+        mock_session_factory.set_payload([], status=404)
 
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = GitHubClient()
-            with pytest.raises(Exception, match="Failed to fetch listings"):
-                await client.fetch_listings()
+        client = GitHubClient()
+        with pytest.raises(Exception, match="Failed to fetch listings"):
+            await client.fetch_listings()
 
-    @pytest.mark.asyncio
-    async def test_fetch_listings_filters_inactive(self, sample_listings_data):
+    def test_fetch_listings_filters_inactive(self, prefetched_scraped_data):
         """Test that inactive internships are filtered out."""
-        mock_session = create_mock_session(sample_listings_data)
-
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = GitHubClient()
-            result = await client.fetch_listings()
+        result = prefetched_scraped_data
 
-            # inactive-1 should not be in results
-            all_ids = [i.id for i in result.summer + result.offseason]
-            assert "inactive-1" not in all_ids
+        # inactive-1 should not be in results
+        all_ids = [i.id for i in result.summer + result.offseason]
+        assert "inactive-1" not in all_ids
 
-    @pytest.mark.asyncio
-    async def test_fetch_listings_categorizes_correctly(self, sample_listings_data):
+    def test_fetch_listings_categorizes_correctly(self, prefetched_scraped_data):
         """Test that internships are categorized correctly."""
-        mock_session = create_mock_session(sample_listings_data)
-
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = GitHubClient()
-            result = await client.fetch_listings()
+        result = prefetched_scraped_data
 
-            summer_ids = {i.id for i in result.summer}
-            offseason_ids = {i.id for i in result.offseason}
+        summer_ids = {i.id for i in result.summer}
+        offseason_ids = {i.id for i in result.offseason}
 
-            assert "summer-1" in summer_ids
-            assert "summer-2" in summer_ids
-            assert "offseason-1" in offseason_ids
+        assert "summer-1" in summer_ids
+        assert "summer-2" in summer_ids
+        assert "offseason-1" in offseason_ids
 
 
 class TestGitHubClientGetNewListings:
     """Test GitHubClient get_new_listings method."""
 
     @pytest.mark.asyncio
-    async def test_get_new_listings_all_new(self, sample_listings_data):
+    async def test_get_new_listings_all_new(self, prefetched_scraped_data):
         """Test getting new listings when nothing was scraped before."""
-        mock_session = create_mock_session(sample_listings_data)
-
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with patch.object(
+            GitHubClient,
+            "fetch_listings",
+            AsyncMock(return_value=prefetched_scraped_data),
+        ):
             client = GitHubClient()
             last_scrape_ids = {"summer": set(), "offseason": set()}
 
@@ -212,32 +234,35 @@ class TestGitHubClientGetNewListings:
             assert len(new_data.offseason) == 1
 
     @pytest.mark.asyncio
-    async def test_get_new_listings_filters_seen(self, sample_listings_data):
+    async def test_get_new_listings_filters_seen(
+        self, sample_listings_data, mock_session_factory
+    ):
         """Test that previously seen listings are filtered out."""
-        mock_session = create_mock_session(sample_listings_data)
+        mock_session_factory.set_payload(sample_listings_data)
 
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = GitHubClient()
-            last_scrape_ids = {
-                "summer": {"summer-1"},  # Already seen
-                "offseason": {"offseason-1"}  # Already seen
-            }
+        client = GitHubClient()
+        last_scrape_ids = {
+            "summer": {"summer-1"},  # Already seen
+            "offseason": {"offseason-1"}  # Already seen
+        }
 
-            new_data, all_data = await client.get_new_listings(last_scrape_ids)
+        new_data, all_data = await client.get_new_listings(last_scrape_ids)
 
-            # summer-2 and old-1 should be new (summer-1 filtered out)
-            assert len(new_data.summer) == 2
-            new_ids = {i.id for i in new_data.summer}
-            assert "summer-2" in new_ids
-            assert "old-1" in new_ids
-            assert len(new_data.offseason) == 0
+        # summer-2 and old-1 should be new (summer-1 filtered out)
+        assert len(new_data.summer) == 2
+        new_ids = {i.id for i in new_data.summer}
+        assert "summer-2" in new_ids
+        assert "old-1" in new_ids
+        assert len(new_data.offseason) == 0
 
     @pytest.mark.asyncio
-    async def test_get_new_listings_returns_all_data(self, sample_listings_data):
+    async def test_get_new_listings_returns_all_data(self, prefetched_scraped_data):
         """Test that get_new_listings returns both new and all data."""
-        mock_session = create_mock_session(sample_listings_data)
-
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with patch.object(
+            GitHubClient,
+            "fetch_listings",
+            AsyncMock(return_value=prefetched_scraped_data),
+        ):
             client = GitHubClient()
             last_scrape_ids = {"summer": set(), "offseason": set()}
 
@@ -248,21 +273,148 @@ class TestGitHubClientGetNewListings:
             assert len(all_data.offseason) == 1
 
     @pytest.mark.asyncio
-    async def test_get_new_listings_with_date_filter(self, sample_listings_data):
+    async def test_get_new_listings_with_date_filter(
+        self, sample_listings_data, mock_session_factory
+    ):
         """Test get_new_listings with start_timestamp."""
         start_timestamp = 1731850000
 
-        mock_session = create_mock_session(sample_listings_data)
+        mock_session_factory.set_payload(sample_listings_data)
+
+        client = GitHubClient()
+        last_scrape_ids = {"summer": set(), "offseason": set()}
+
+        new_data, all_data = await client.get_new_listings(
+            last_scrape_ids,
+            start_timestamp=start_timestamp
+        )
+
+        # Only entries after timestamp
+        assert len(new_data.summer) == 2
+        assert len(new_data.offseason) == 0
+
+
+class TestGitHubClientConditionalRequests:
+    """Test ETag/Last-Modified handling in fetch_listings."""
 
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_listings(
+        self, sample_listings_data, mock_session_factory
+    ):
+        """Test that a 304 reuses parsed listings and still filters by date."""
+        client = GitHubClient()
+        mock_session_factory.set_payload(sample_listings_data, headers={"ETag": '"v1"'})
+        first = await client.fetch_listings()
+
+        mock_session_factory.set_payload(None, status=304)
+        filtered = await client.fetch_listings(start_timestamp=1731850000)
+
+        assert mock_session_factory.last_request_headers()["If-None-Match"] == '"v1"'
+        assert {i.id for i in filtered.summer} == {"summer-1", "summer-2"}
+        assert filtered.offseason == []
+        assert await client.fetch_listings() is first
+
+    @pytest.mark.asyncio
+    async def test_validators_sent_only_with_cached_listings(
+        self, sample_listings_data, mock_session_factory
+    ):
+        """Test that conditional headers are only sent once listings are cached."""
+        client = GitHubClient()
+        mock_session_factory.set_payload(
+            sample_listings_data,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+
+        await client.fetch_listings()
+        assert "If-None-Match" not in mock_session_factory.last_request_headers()
+
+        await client.fetch_listings()
+        headers = mock_session_factory.last_request_headers()
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_failed_parse_keeps_previous_etag(
+        self, sample_listings_data, mock_session_factory
+    ):
+        """Test that a response that fails to parse does not replace the ETag."""
+        client = GitHubClient()
+        mock_session_factory.set_payload(sample_listings_data, headers={"ETag": '"v1"'})
+        first = await client.fetch_listings()
+
+        mock_session_factory.set_payload(sample_listings_data, headers={"ETag": '"v2"'})
+        with patch.object(
+            GitHubClient, "_parse_listings", side_effect=ValueError("bad listing")
+        ):
+            with pytest.raises(ValueError):
+                await client.fetch_listings()
+
+        mock_session_factory.set_payload(None, status=304)
+        assert await client.fetch_listings() is first
+        assert mock_session_factory.last_request_headers()["If-None-Match"] == '"v1"'
+
+
+class TestGitHubClientRateLimit:
+    """Test retries on HTTP 429."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried_after_retry_after(self, mock_session_factory):
+        """Test that 429 responses are retried after their Retry-After delay."""
+        mock_session_factory.set_payload([], status=429, headers={"Retry-After": "3"})
+        mock_session_factory.session.get.reset_mock()
+        sleep = AsyncMock()
+
+        with patch("src.utils.retry.asyncio.sleep", sleep):
             client = GitHubClient()
-            last_scrape_ids = {"summer": set(), "offseason": set()}
+            with pytest.raises(RateLimitError):
+                await client.fetch_listings()
 
-            new_data, all_data = await client.get_new_listings(
-                last_scrape_ids,
-                start_timestamp=start_timestamp
-            )
+        assert mock_session_factory.session.get.call_count == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [3.0, 3.0]
+
+
+class TestGitHubClientInvalidListings:
+    """Test that malformed rows are dropped without losing valid ones."""
+
+    @pytest.fixture
+    def listings_with_bad_rows(self, sample_listings_data):
+        """sample_listings_data with invalid and non-dict rows mixed in."""
+        bad_date = {**sample_listings_data[0], "id": "bad-date", "date_posted": "abc"}
+        bad_id = {**sample_listings_data[1], "id": None}
+        return [
+            sample_listings_data[0],
+            bad_date,
+            "not a listing",
+            sample_listings_data[1],
+            bad_id,
+            None,
+            *sample_listings_data[2:],
+        ]
+
+    def test_validate_listings_drops_invalid_rows(self, listings_with_bad_rows):
+        """Test that only invalid rows are dropped and input order is kept."""
+        rows = [row for row in listings_with_bad_rows if isinstance(row, dict)]
+
+        internships = GitHubClient._validate_listings(rows)
+
+        assert [i.id for i in internships] == [
+            "summer-1",
+            "summer-2",
+            "offseason-1",
+            "old-1",
+            "inactive-1",
+        ]
 
-            # Only entries after timestamp
-            assert len(new_data.summer) == 2
-            assert len(new_data.offseason) == 0
+    @pytest.mark.asyncio
+    async def test_fetch_listings_skips_bad_rows(
+        self, listings_with_bad_rows, prefetched_scraped_data, mock_session_factory
+    ):
+        """Test that bad and non-dict rows don't change the parsed result."""
+        mock_session_factory.set_payload(listings_with_bad_rows)
+
+        result = await GitHubClient().fetch_listings()
+
+        assert [i.id for i in result.summer] == [
+            i.id for i in prefetched_scraped_data.summer
+        ]
+        assert [i.id for i in result.offseason] == ["offseason-1"]
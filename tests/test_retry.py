@@ -0,0 +1,93 @@
+"""Tests for retry_with_backoff."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.scraper.exceptions import FetchError, RateLimitError
+from src.utils import retry
+from src.utils.retry import retry_with_backoff
+
+
+@pytest.fixture
+def sleep(monkeypatch):
+    """Record waits instead of sleeping."""
+    mock = AsyncMock()
+    monkeypatch.setattr(retry.asyncio, "sleep", mock)
+    return mock
+
+
+@pytest.fixture
+def uniform(monkeypatch):
+    """Make jitter deterministic by always picking the upper bound."""
+    mock = MagicMock(side_effect=lambda low, high: high)
+    monkeypatch.setattr(retry.random, "uniform", mock)
+    return mock
+
+
+def failing(*errors, result="ok"):
+    """Async function raising each error in turn, then returning result."""
+    return AsyncMock(side_effect=[*errors, result])
+
+
+def waits(sleep):
+    """Seconds passed to each awaited sleep."""
+    return [call.args[0] for call in sleep.await_args_list]
+
+
+class TestRetryWithBackoff:
+    """Test backoff, jitter and retry_after handling."""
+
+    @pytest.mark.asyncio
+    async def test_jitter_within_exponential_delay(self, sleep, uniform):
+        """Test that each wait is drawn from [0, delay] with the delay doubling."""
+        func = failing(FetchError("a"), FetchError("b"))
+
+        assert await retry_with_backoff(func, max_retries=3) == "ok"
+
+        assert [call.args for call in uniform.call_args_list] == [(0, 1.0), (0, 2.0)]
+        assert waits(sleep) == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_delay_capped_at_max_delay(self, sleep, uniform):
+        """Test that the jitter range never exceeds max_delay."""
+        func = failing(FetchError("a"), FetchError("b"))
+
+        await retry_with_backoff(
+            func, max_retries=3, initial_delay=10.0, backoff_factor=10.0, max_delay=15.0
+        )
+
+        assert [call.args for call in uniform.call_args_list] == [(0, 10.0), (0, 15.0)]
+
+    @pytest.mark.asyncio
+    async def test_uses_retry_after(self, sleep, uniform):
+        """Test that retry_after replaces the jittered delay, capped at max_delay."""
+        func = failing(
+            RateLimitError("slow down", retry_after=7.0),
+            RateLimitError("slow down", retry_after=120.0),
+        )
+
+        await retry_with_backoff(func, max_retries=3, max_delay=60.0)
+
+        uniform.assert_not_called()
+        assert waits(sleep) == [7.0, 60.0]
+
+    @pytest.mark.asyncio
+    async def test_raises_last_exception(self, sleep, uniform):
+        """Test that the last error is raised once attempts run out."""
+        func = failing(FetchError("first"), FetchError("last"))
+
+        with pytest.raises(FetchError, match="last"):
+            await retry_with_backoff(func, max_retries=2)
+
+        assert func.await_count == 2
+        assert len(waits(sleep)) == 1
+
+    @pytest.mark.asyncio
+    async def test_other_exceptions_not_retried(self, sleep, uniform):
+        """Test that exceptions outside the retry list propagate immediately."""
+        func = failing(ValueError("bug"))
+
+        with pytest.raises(ValueError):
+            await retry_with_backoff(func, exceptions=(FetchError,))
+
+        sleep.assert_not_awaited()
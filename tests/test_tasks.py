@@ -0,0 +1,274 @@
+"""Tests for the scheduler's posting pipeline."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from src.config.config_manager import ConfigManager
+from src.scheduler import tasks
+from src.scheduler.tasks import ChannelPoster, ChannelRateLimiter, PosterClosedError
+from src.scraper.data_models import Internship, ScrapedData
+
+SUMMER_CHANNEL_ID = 100
+OFFSEASON_CHANNEL_ID = 200
+
+
+def make_internship(internship_id, terms):
+    """Build a listing without running validation."""
+    return Internship.model_construct(
+        id=internship_id,
+        company_name="Test",
+        title="Test Intern",
+        locations=["Remote"],
+        terms=terms,
+        sponsorship="",
+        active=True,
+        is_visible=True,
+        url="https://test.com",
+        date_posted=1700000000,
+        date_updated=1700000000,
+        source="test",
+        company_url="",
+    )
+
+
+class MockChannel:
+    """Channel that records sent messages and can hold sends until released."""
+    def __init__(self, channel_id, blocked=False):
+        self.id = channel_id
+        self.sent = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def send(self, embeds):
+        await self.release.wait()
+        self.sent.append(embeds)
+
+
+@pytest.fixture
+async def poster(monkeypatch):
+    """Fresh poster, rate limiter and pending-scrape set for each test."""
+    poster = ChannelPoster()
+    monkeypatch.setattr(tasks, "_poster", poster)
+    monkeypatch.setattr(tasks, "_channel_limiter", ChannelRateLimiter())
+    monkeypatch.setattr(tasks, "_pending_scrapes", set())
+    yield poster
+    poster.close()
+    # Let cancelled workers finish before the loop closes
+    await asyncio.sleep(0)
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """ConfigManager with both channel types configured."""
+    manager = ConfigManager(tmp_path / "config.json", tmp_path / "last_scrape.pkl")
+    manager.set_channel(1, "summer", SUMMER_CHANNEL_ID)
+    manager.set_channel(1, "offseason", OFFSEASON_CHANNEL_ID)
+    return manager
+
+
+@pytest.fixture
+def listings():
+    """One new summer and one new off-season listing."""
+    return ScrapedData(
+        summer=[make_internship("summer-1", ["Summer 2026"])],
+        offseason=[make_internship("offseason-1", ["Fall 2025"])],
+    )
+
+
+def make_bot(channels, *results):
+    """Mock bot whose client returns each (new, all) result in turn."""
+    bot = MagicMock()
+    bot.github_client.get_new_listings = AsyncMock(side_effect=list(results))
+    bot.get_channel = lambda channel_id: channels.get(channel_id)
+    return bot
+
+
+async def settle():
+    """Give queued tasks a few turns of the event loop."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestBatchEmbeds:
+    """Test grouping embeds into messages within Discord's limits."""
+
+    def test_splits_at_embed_count_limit(self):
+        """Test that 23 embeds become messages of 10, 10 and 3."""
+        embeds = [discord.Embed(title=f"Listing {i}") for i in range(23)]
+
+        batches = tasks._batch_embeds(embeds)
+
+        assert [len(batch) for batch in batches] == [10, 10, 3]
+        assert [e for batch in batches for e in batch] == embeds
+
+    def test_splits_early_at_character_limit(self):
+        """Test that a batch closes before its embeds exceed 6000 characters."""
+        embeds = [discord.Embed(description="x" * 2500) for _ in range(3)]
+
+        batches = tasks._batch_embeds(embeds)
+
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_no_embeds(self):
+        """Test that nothing to post gives no batches."""
+        assert tasks._batch_embeds([]) == []
+
+
+class TestChannelRateLimiter:
+    """Test per-channel send pacing."""
+
+    @pytest.mark.asyncio
+    async def test_sixth_send_waits_for_rest_of_window(self, monkeypatch):
+        """Test that 5 sends go straight through and the 6th waits out the window."""
+        clock = [100.0]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(tasks.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(tasks.asyncio, "sleep", fake_sleep)
+        limiter = ChannelRateLimiter(rate=5, period=5.0)
+
+        # One send per second from t=100 to t=104
+        for i in range(5):
+            clock[0] = 100.0 + i
+            await limiter.acquire(SUMMER_CHANNEL_ID)
+        assert sleeps == []
+
+        # Sixth send at t=104: the t=100 send leaves the window at t=105
+        await limiter.acquire(SUMMER_CHANNEL_ID)
+
+        assert sleeps == [pytest.approx(1.0)]
+
+    @pytest.mark.asyncio
+    async def test_channels_are_limited_separately(self, monkeypatch):
+        """Test that one busy channel does not delay another."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(tasks.time, "monotonic", lambda: 100.0)
+        monkeypatch.setattr(tasks.asyncio, "sleep", sleep)
+        limiter = ChannelRateLimiter(rate=5, period=5.0)
+
+        for _ in range(5):
+            await limiter.acquire(SUMMER_CHANNEL_ID)
+        await limiter.acquire(OFFSEASON_CHANNEL_ID)
+
+        sleep.assert_not_awaited()
+
+
+class TestChannelPoster:
+    """Test per-channel posting queues."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_post_in_order(self, poster):
+        """Test that jobs for one channel are posted in submission order."""
+        channel = MockChannel(SUMMER_CHANNEL_ID)
+
+        first = await poster.submit(channel, [["a"], ["b"]])
+        second = await poster.submit(channel, [["c"]])
+
+        assert await first == (2, 0)
+        assert await second == (1, 0)
+        assert channel.sent == [["a"], ["b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_close_fails_queued_and_in_flight_jobs(self, poster):
+        """Test that close() fails every unfinished job with PosterClosedError."""
+        channel = MockChannel(SUMMER_CHANNEL_ID, blocked=True)
+        in_flight = await poster.submit(channel, [["a"]])
+        queued = await poster.submit(channel, [["b"]])
+        await settle()
+
+        poster.close()
+
+        with pytest.raises(PosterClosedError):
+            await in_flight
+        with pytest.raises(PosterClosedError):
+            await queued
+        assert channel.sent == []
+
+
+class TestBackgroundScrape:
+    """Test scrapes that keep posting after they return (wait=False)."""
+
+    @pytest.mark.asyncio
+    async def test_last_scrape_saved_after_jobs_finish(
+        self, poster, config_manager, listings
+    ):
+        """Test that listing IDs are recorded only once posting is done."""
+        summer = MockChannel(SUMMER_CHANNEL_ID, blocked=True)
+        offseason = MockChannel(OFFSEASON_CHANNEL_ID)
+        bot = make_bot(
+            {SUMMER_CHANNEL_ID: summer, OFFSEASON_CHANNEL_ID: offseason},
+            (listings, listings),
+        )
+
+        await tasks._scrape_core(bot, config_manager, wait=False)
+        await settle()
+        assert config_manager.get_last_scrape() == {"summer": set(), "offseason": set()}
+
+        summer.release.set()
+        await asyncio.gather(*tasks._pending_scrapes)
+
+        assert len(summer.sent) == 1
+        assert config_manager.get_last_scrape() == {
+            "summer": {"summer-1"},
+            "offseason": {"offseason-1"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_last_scrape_unchanged(
+        self, poster, config_manager, listings
+    ):
+        """Test that jobs dropped at shutdown are not recorded as seen."""
+        summer = MockChannel(SUMMER_CHANNEL_ID, blocked=True)
+        offseason = MockChannel(OFFSEASON_CHANNEL_ID)
+        bot = make_bot(
+            {SUMMER_CHANNEL_ID: summer, OFFSEASON_CHANNEL_ID: offseason},
+            (listings, listings),
+        )
+        # Occupy the summer worker so the scrape's job waits in the queue
+        in_flight = await poster.submit(summer, [["earlier"]])
+
+        await tasks._scrape_core(bot, config_manager, wait=False)
+        pending = list(tasks._pending_scrapes)
+        await settle()
+
+        poster.close()
+
+        with pytest.raises(PosterClosedError):
+            await in_flight
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        assert isinstance(results[0], PosterClosedError)
+        assert config_manager.get_last_scrape() == {"summer": set(), "offseason": set()}
+
+    @pytest.mark.asyncio
+    async def test_next_scrape_waits_for_pending_scrape(
+        self, poster, config_manager, listings
+    ):
+        """Test that a scrape does not fetch until the previous one has posted."""
+        summer = MockChannel(SUMMER_CHANNEL_ID, blocked=True)
+        offseason = MockChannel(OFFSEASON_CHANNEL_ID)
+        bot = make_bot(
+            {SUMMER_CHANNEL_ID: summer, OFFSEASON_CHANNEL_ID: offseason},
+            (listings, listings),
+            (ScrapedData(), listings),
+        )
+
+        await tasks._scrape_core(bot, config_manager, wait=False)
+        next_scrape = asyncio.create_task(tasks._scrape_core(bot, config_manager))
+        await settle()
+
+        assert not next_scrape.done()
+        assert bot.github_client.get_new_listings.await_count == 1
+
+        summer.release.set()
+        stats = await next_scrape
+
+        assert bot.github_client.get_new_listings.await_count == 2
+        assert stats["total_new"] == 0
+        assert len(summer.sent) == 1